@@ -3,6 +3,8 @@ Agent factory for creating and managing agents based on configuration.
 """
 
 import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, List
 from langchain_openai import ChatOpenAI
 from .base_agent import BaseAgent
@@ -47,49 +49,7 @@ class AgentFactory:
         """
         Get dictionary of available agent templates with their information.
         """
-        import os
-        from pathlib import Path
-        
-        templates_dir = Path(__file__).parent / "templates"
-        available = {}
-        
-        if templates_dir.exists():
-            for template_file in templates_dir.glob("*.md"):
-                agent_id = template_file.stem
-                
-                # Try to load agent info from template
-                try:
-                    with open(template_file, "r", encoding="utf-8") as f:
-                        template_content = f.read()
-                    
-                    # Extract basic info from template
-                    lines = template_content.split('\n')
-                    name = agent_id.replace('_', ' ').title()
-                    focus = ""
-                    hates = ""
-                    
-                    for i, line in enumerate(lines):
-                        if line.startswith('**Focus**:'):
-                            focus = line.replace('**Focus**:', '').strip()
-                        elif line.startswith('**What you hate**:'):
-                            hates = line.replace('**What you hate**:', '').strip()
-                    
-                    available[agent_id] = {
-                        "name": name,
-                        "focus": focus,
-                        "hates": hates,
-                        "template_path": str(template_file)
-                    }
-                except Exception as e:
-                    # Fallback if template can't be parsed
-                    available[agent_id] = {
-                        "name": agent_id.replace('_', ' ').title(),
-                        "focus": "Not specified",
-                        "hates": "Not specified",
-                        "template_path": str(template_file)
-                    }
-        
-        return available
+        return _scan_agent_templates()
     
     def validate_agent_config(self, agent_config: List[str]) -> Dict[str, Any]:
         """
@@ -115,4 +75,49 @@ class AgentFactory:
             validation_result["errors"].append("No agents specified")
             validation_result["valid"] = False
         
-        return validation_result 
\ No newline at end of file
+        return validation_result
+
+
+@lru_cache(maxsize=1)
+def _scan_agent_templates() -> Dict[str, Dict[str, Any]]:
+    """Parse the bundled agent templates once per process."""
+    templates_dir = Path(__file__).parent / "templates"
+    available = {}
+    
+    if templates_dir.exists():
+        for template_file in templates_dir.glob("*.md"):
+            agent_id = template_file.stem
+            
+            # Try to load agent info from template
+            try:
+                with open(template_file, "r", encoding="utf-8") as f:
+                    template_content = f.read()
+                
+                # Extract basic info from template
+                lines = template_content.split('\n')
+                name = agent_id.replace('_', ' ').title()
+                focus = ""
+                hates = ""
+                
+                for i, line in enumerate(lines):
+                    if line.startswith('**Focus**:'):
+                        focus = line.replace('**Focus**:', '').strip()
+                    elif line.startswith('**What you hate**:'):
+                        hates = line.replace('**What you hate**:', '').strip()
+                
+                available[agent_id] = {
+                    "name": name,
+                    "focus": focus,
+                    "hates": hates,
+                    "template_path": str(template_file)
+                }
+            except Exception as e:
+                # Fallback if template can't be parsed
+                available[agent_id] = {
+                    "name": agent_id.replace('_', ' ').title(),
+                    "focus": "Not specified",
+                    "hates": "Not specified",
+                    "template_path": str(template_file)
+                }
+    
+    return available
@@ -4,20 +4,116 @@ Generic agent class that loads templates and can be configured for different rol
 
 import logging
 import re
-import json
 import asyncio
 import os
+import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
+import httpx
 
 from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 
-from ..utils.config_loader import ConfigLoader
+from ..utils import json_io
+from ..utils.config_loader import get_config_loader
+from ..utils.llm_cache import LLMCache, get_llm_cache
+from ..utils.retry import with_retry
+from ..utils.batch_client import BatchDispatcher
 import random
 
 
+# The request cap, HTTP pool and model clients are bound to the event loop that first uses them,
+# so they are kept per loop; separate asyncio.run() calls never share them
+_LOOP_STATE: Dict[asyncio.AbstractEventLoop, Dict[str, Any]] = {}
+
+# Queueing for an LLM slot longer than this (seconds) is logged; shorter waits are normal
+_SLOT_WAIT_LOG_THRESHOLD = 1.0
+
+
+def _loop_state() -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    state = _LOOP_STATE.get(loop)
+    if state is None:
+        for closed in [l for l in _LOOP_STATE if l.is_closed()]:
+            del _LOOP_STATE[closed]
+        state = _LOOP_STATE[loop] = {
+            # Caps in-flight model requests across all agents to stay under provider rate limits
+            "semaphore": asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_AGENTS", "8"))),
+            "http_client": None,
+            "llms": {}
+        }
+    return state
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's cap on in-flight model requests."""
+    return _loop_state()["semaphore"]
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive HTTP pool shared by every model client on the running loop."""
+    state = _loop_state()
+    if state["http_client"] is None:
+        max_connections = int(os.getenv("LLM_MAX_CONNECTIONS", "64"))
+        state["http_client"] = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections // 2),
+            timeout=httpx.Timeout(600.0, connect=10.0)
+        )
+    return state["http_client"]
+
+
+def _get_llm(model: str, temperature: float) -> ChatOpenAI:
+    """Return one ChatOpenAI per (model, temperature) on the running loop, all on its shared connection pool."""
+    llms = _loop_state()["llms"]
+    key = (model, temperature)
+    if key not in llms:
+        llms[key] = ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            http_async_client=_get_http_client()
+        )
+    return llms[key]
+
+
+def _find_json_obj(s: str) -> Optional[str]:
+    """Return the first balanced top-level JSON object in ``s``, or None."""
+    start = s.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return None
+
+
+def _cache_key(llm_config: Dict[str, Any], messages: list) -> str:
+    """Build the response cache key for a list of LangChain messages."""
+    return LLMCache.make_key(
+        llm_config["model"],
+        [{"role": m.type, "content": m.content} for m in messages],
+        llm_config["temperature"]
+    )
+
+
 class AgentOutput(BaseModel):
     """Output model for agent reviews."""
     agent_name: str
@@ -40,14 +136,17 @@ class BaseAgent:
         self.agent_config = self._parse_template(self.template)
         
         # Initialize LangChain LLM
-        config_loader = ConfigLoader()
+        config_loader = get_config_loader()
         llm_config = config_loader.get_llm_config("agent_reviews")
+        self.llm_config = llm_config
         
-        self.llm = ChatOpenAI(
-            model=llm_config["model"],
-            temperature=llm_config["temperature"],
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        # Set by the workflow in --batch-mode to route calls through the Batch API
+        self.batch_dispatcher: Optional[BatchDispatcher] = None
+    
+    @property
+    def llm(self) -> ChatOpenAI:
+        """Chat model for this agent on the running event loop."""
+        return _get_llm(self.llm_config["model"], self.llm_config["temperature"])
     
     def _load_template(self, agent_id: str) -> str:
         """Load agent template from file."""
@@ -105,8 +204,7 @@ class BaseAgent:
         ]
         
         # Make the LLM call using LangChain async
-        response = await self.llm.ainvoke(messages)
-        feedback = response.content
+        feedback = await self._invoke_llm(messages)
         
         # Extract scores
         scores = self._extract_scores_from_feedback(feedback)
@@ -122,13 +220,51 @@ class BaseAgent:
             confidence=0.8
         )
     
+    async def _invoke_llm(self, messages: list) -> str:
+        """Call the agent LLM, serving repeated requests from the response cache."""
+        cache = get_llm_cache()
+        key = _cache_key(self.llm_config, messages) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                self.logger.info("Using cached LLM response")
+                return cached
+        
+        if self.batch_dispatcher is not None:
+            content = await self.batch_dispatcher.complete(self.agent_id, {
+                "model": self.llm_config["model"],
+                "temperature": self.llm_config["temperature"],
+                "messages": [
+                    {"role": "user" if m.type == "human" else m.type, "content": m.content}
+                    for m in messages
+                ]
+            })
+            if key is not None:
+                cache.set(key, content)
+            return content
+        
+        async def call():
+            wait_start = time.perf_counter()
+            async with _llm_semaphore():
+                # Time spent queued here is the signal for tuning MAX_CONCURRENT_AGENTS
+                waited = time.perf_counter() - wait_start
+                if waited > _SLOT_WAIT_LOG_THRESHOLD:
+                    self.logger.info(f"Waited {waited:.3f}s for an LLM slot")
+                return await self.llm.ainvoke(messages)
+        
+        # Retry transient failures per agent so one 429 does not abort the whole review
+        response = await with_retry(call, logger=self.logger)
+        if key is not None:
+            cache.set(key, response.content)
+        return response.content
+    
     def _create_agent_prompt(self, proposal_text: str, supporting_docs: List[Dict[str, Any]], 
                             criteria: Dict[str, Any], solicitation_md: str) -> str:
         """
         Create agent-specific prompt using template.
         """
         # Combine supporting docs text
-        supporting_text = ""
+        supporting_parts = []
         for doc in supporting_docs:
             # Extract full_text from the standardized document structure
             if 'full_text' not in doc:
@@ -136,7 +272,9 @@ class BaseAgent:
             content_text = doc['full_text']
             if not content_text or content_text.strip() == "":
                 raise ValueError(f"Document {doc.get('file_name', 'unknown')} has empty or missing content")
-            supporting_text += f"\n\n--- {doc['file_name']} ---\n{content_text}"
+            supporting_parts.append(f"\n\n--- {doc['file_name']} ---\n{content_text}")
+        # Join once; repeated += copies every earlier document for each new one
+        supporting_text = "".join(supporting_parts)
         
         # Create criteria summary
         criteria_summary = ""
@@ -214,10 +352,9 @@ Provide a comprehensive review based on your role focus. Be specific, actionable
         # Try to extract JSON from the response (for panel scorer)
         if self.agent_id == "panel_scorer":
             try:
-                json_match = re.search(r'\{.*\}', feedback, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                    score_data = json.loads(json_str)
+                json_str = _find_json_obj(feedback)
+                if json_str:
+                    score_data = json_io.loads(json_str)
                     
                     for criterion, data in score_data.items():
                         if isinstance(data, dict) and "score" in data:
@@ -226,7 +363,8 @@ Provide a comprehensive review based on your role focus. Be specific, actionable
                                 scores[criterion] = float(score)
                     
                     return scores
-            except (json.JSONDecodeError, KeyError, TypeError):
+            # ValueError covers json.JSONDecodeError and the orjson/simdjson decode errors
+            except (ValueError, KeyError, TypeError):
                 pass
         
         # Generic score extraction
@@ -284,13 +422,9 @@ class PanelScorerAgent(BaseAgent):
         self.logger.info(f"[PanelScorerAgent] Top-level criteria keys: {list(criteria.keys())}")
         if "types" in criteria:
             criteria = criteria["types"]
-        config_loader = ConfigLoader()
+        config_loader = get_config_loader()
         llm_config = config_loader.get_llm_config("panel_scorer")
-        llm = ChatOpenAI(
-            model=llm_config["model"],
-            temperature=llm_config["temperature"],
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        llm = _get_llm(llm_config["model"], llm_config["temperature"])
         def flatten_criteria(criteria):
             flat = []
             for crit_type, type_data in criteria.items():
@@ -312,13 +446,12 @@ class PanelScorerAgent(BaseAgent):
         eval_criteria = flatten_criteria(criteria)
         self.logger.info(f"[PanelScorerAgent] {len(eval_criteria)} criteria to score.")
         system_content = self.template
-        supporting_text = ""
-        for doc in supporting_docs:
-            supporting_text += f"\n\n--- {doc.get('file_name', 'doc')} ---\n{doc.get('full_text', '')}"
+        supporting_text = "".join(
+            f"\n\n--- {doc.get('file_name', 'doc')} ---\n{doc.get('full_text', '')}"
+            for doc in supporting_docs
+        )
         context = f"## Solicitation Context\n{solicitation_md}\n\n## Main Proposal\n{proposal_text}\n\n## Supporting Documents\n{supporting_text}"
-        import re, json, asyncio
         # Load batching/retry config from system_config.json
-        config_loader = ConfigLoader()
         scorer_config = config_loader.config.get('llm', {}).get('panel_scorer', {})
         batch_config = scorer_config.get('batch', {})
         batch_size = batch_config.get('batch_size', 2)
@@ -331,11 +464,12 @@ class PanelScorerAgent(BaseAgent):
             # Replace single backslashes not followed by valid escape with double backslash
             s = re.sub(r'(?<!\\)\\(?!["/bfnrtu])', r'\\', s)
             try:
-                return json.loads(s)
-            except json.JSONDecodeError as e:
+                return json_io.loads(s)
+            except ValueError as e:
                 self.logger.error(f"[PanelScorerAgent] JSON decode error: {e}\nRaw: {s}")
                 raise
         llm_structured = llm.with_structured_output(CriterionScore)
+        cache = get_llm_cache()
         async def score_criterion(criterion):
             crit_id = f"{criterion['type']}|{criterion['category']}|{criterion['sub_category']}"
             for attempt in range(max_retries):
@@ -371,10 +505,20 @@ Return your answer as a JSON object with the following fields:
 {context}
 """
                     messages = [SystemMessage(content=system_content), HumanMessage(content=prompt)]
+                    cache_key = _cache_key(llm_config, messages) if cache is not None else None
+                    if cache_key is not None:
+                        cached = cache.get(cache_key)
+                        if cached is not None:
+                            result = CriterionScore.model_validate_json(cached)
+                            return criterion, result.model_dump(), cached
                     try:
-                        result = await llm_structured.ainvoke(messages)
+                        async with _llm_semaphore():
+                            result = await llm_structured.ainvoke(messages)
                         if isinstance(result, CriterionScore):
-                            return criterion, result.dict(), result.json()
+                            result_json = result.model_dump_json()
+                            if cache_key is not None:
+                                cache.set(cache_key, result_json)
+                            return criterion, result.model_dump(), result_json
                     except Exception as e:
                         err_str = str(e).lower()
                         if "rate limit" in err_str or "429" in err_str:
@@ -434,10 +578,12 @@ Return your answer as a JSON object with the following fields:
         # Save markdown table to file
         output_dir.mkdir(parents=True, exist_ok=True)
         table_path = output_dir / "panel_scorer_results.md"
+        # Serialize the raw scores once; both the file and the feedback embed them
+        raw_json = json_io.dumps(scores_json, indent=True).decode("utf-8")
         with open(table_path, "w", encoding="utf-8") as f:
-            f.write(f"# Panel Scorer Results\n\n{summary}\n\n{markdown_table}\n\n<details><summary>Raw JSON</summary>\n\n```json\n{json.dumps(scores_json, indent=2)}\n```\n</details>\n\nMarkdown table saved to: {table_path}")
+            f.write(f"# Panel Scorer Results\n\n{summary}\n\n{markdown_table}\n\n<details><summary>Raw JSON</summary>\n\n```json\n{raw_json}\n```\n</details>\n\nMarkdown table saved to: {table_path}")
         # Compose feedback: summary + markdown table + raw JSON
-        feedback = f"### Panel Scorer Results\n\n{summary}\n{markdown_table}\n\n<details><summary>Raw JSON</summary>\n\n```json\n{json.dumps(scores_json, indent=2)}\n```\n</details>\n\nMarkdown table saved to: {table_path}"
+        feedback = f"### Panel Scorer Results\n\n{summary}\n{markdown_table}\n\n<details><summary>Raw JSON</summary>\n\n```json\n{raw_json}\n```\n</details>\n\nMarkdown table saved to: {table_path}"
         return AgentOutput(
             agent_name=self.agent_id,
             feedback=feedback,
@@ -3,20 +3,25 @@ CLI interface for the multi-agent proposal review system.
 """
 
 import argparse
+import asyncio
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Optional, Tuple
 
-from .core.document_processor import DocumentProcessor
-from .core.file_discovery import FileDiscovery
-from .workflow.review_graph import ReviewWorkflow, create_workflow_visualization
-from .utils.output_formatters import OutputFormatter
+from .utils.env import load_env_once
 
 
+@lru_cache(maxsize=1)
 def validate_environment():
     """Validate required environment variables."""
-    load_dotenv()
+    load_env_once()
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         print("Error: OPENAI_API_KEY not set in environment.")
@@ -25,41 +30,182 @@ def validate_environment():
     return api_key, model
 
 
-async def run_review_command(args):
-    """Run the multi-agent review workflow."""
-    print("=== Multi-Agent Proposal Review ===")
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a 64 KiB write buffer that only flushes on WARNING+ records and close."""
+
+    buffer_size = 65536
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, buffering=self.buffer_size)
+
+    def flush(self):
+        # Skip the per-record flush StreamHandler.emit performs; close() still flushes
+        pass
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.WARNING and self.stream:
+            self.acquire()
+            try:
+                self.stream.flush()
+            finally:
+                self.release()
+
+
+OUTPUT_DIR = Path("output")
+_OUTPUT_READY = False
+
+
+def _ensure_output_dir():
+    """Create the output directory on first use only."""
+    global _OUTPUT_READY
+    if not _OUTPUT_READY:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        _OUTPUT_READY = True
+
+
+def setup_logging(output_dir: Path = OUTPUT_DIR):
+    """Log to output/review.log and the console through a background queue listener."""
+    if output_dir is OUTPUT_DIR:
+        _ensure_output_dir()
+    else:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    file_handler = BufferedFileHandler(output_dir / "review.log", mode="a", encoding="utf-8", delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setLevel(logging.WARNING)
+    stream_handler.setFormatter(formatter)
+    # Records are only enqueued on the event loop thread; the listener thread does the writes
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Leave formatting to the listener's handlers; only merge args into the message here
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+
+
+def setup_observability():
+    """Sample LangSmith traces and flush them in the background when tracing is configured."""
+    if not (os.getenv("LANGSMITH_API_KEY") or os.getenv("LANGCHAIN_API_KEY")):
+        return
+    # LangSmith batches runs on a background thread; only the sampling rate needs setting
+    os.environ.setdefault("LANGSMITH_TRACING_SAMPLING_RATE", os.getenv("LS_SAMPLE", "1.0"))
+    from langchain_core.tracers.langchain import wait_for_all_tracers
+    atexit.register(wait_for_all_tracers)
+
+
+_RUNNER = None
+
+# Bounded pool for output file writes so large dumps cannot exhaust file descriptors
+_IO_POOL = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2), thread_name_prefix="cli-io")
+
+
+def _run(coro):
+    """Run a coroutine on a shared event loop, using uvloop when it is installed."""
+    global _RUNNER
+    if _RUNNER is None:
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+        _RUNNER = asyncio.Runner(loop_factory=loop_factory)
+        atexit.register(_RUNNER.close)
+    return _RUNNER.run(coro)
+
+
+@lru_cache(maxsize=16)
+def _parse_agents(agents: Optional[str]) -> Tuple[str, ...]:
+    """Split a comma-separated --agents value into a hashable tuple."""
+    return tuple(agents.split(",")) if agents else ()
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Build the chat client once and share it across commands."""
     api_key, model = validate_environment()
     from langchain_openai import ChatOpenAI
-    client = ChatOpenAI(api_key=api_key, model=model)
+    return ChatOpenAI(api_key=api_key, model=model)
+
+
+def validate_directories(proposal_dir: Path, supporting_dir: Path, solicitation_dir: Path):
+    """Exit early if a required input directory or the solicitation's criteria.json is missing."""
+    for label, path in (("Proposal", proposal_dir), ("Supporting docs", supporting_dir), ("Solicitation", solicitation_dir)):
+        if not path.is_dir():
+            logging.getLogger("cli").error(f"{label} directory not found: {path}")
+            print(f"Error: {label} directory not found: {path}", file=sys.stderr)
+            sys.exit(2)
+    criteria_file = solicitation_dir / "criteria.json"
+    if not criteria_file.is_file():
+        logging.getLogger("cli").error(f"criteria.json not found: {criteria_file}")
+        print(f"Error: criteria.json not found: {criteria_file}", file=sys.stderr)
+        sys.exit(2)
+
+
+# Upper bound on waiting for the diagram once the review is done; mmdr itself times out at 30s
+_VISUALIZATION_TIMEOUT = 60
+
+
+async def _report_visualization(visualization: asyncio.Task):
+    """Wait for the background workflow diagram and report where it was saved."""
+    try:
+        # wait_for cancels the task on timeout, so it is never left pending
+        png_file = await asyncio.wait_for(visualization, _VISUALIZATION_TIMEOUT)
+        if png_file:
+            print(f"Workflow visualization saved: {png_file}")
+        else:
+            print("Workflow visualization failed")
+    except Exception as e:
+        print(f"Workflow visualization failed: {e}")
+
+
+async def run_review_command(args):
+    """Run the multi-agent review workflow."""
     proposal_dir = Path(args.proposal_dir)
     supporting_dir = Path(args.supporting_dir)
     solicitation_dir = Path(args.solicitation_dir)
-    output_dir = Path("output")
-    print(f"Proposal directory: {proposal_dir}")
-    print(f"Supporting docs directory: {supporting_dir}")
-    print(f"Solicitation directory: {solicitation_dir}")
-    print(f"Output directory: {output_dir}")
-    agent_config = args.agents.split(',') if args.agents else None
-    print(f"Agent configuration: {agent_config}")
-    print(f"Document processing flag: {args.process_docs}")
+    # Check paths before paying for imports and client setup
+    validate_directories(proposal_dir, supporting_dir, solicitation_dir)
+    # Imported here so --help does not pay for langgraph/marker imports
+    from .workflow.review_graph import ReviewWorkflow, create_workflow_visualization
+    from .utils.output_formatters import OutputFormatter
+    from .utils.retry import RETRYABLE_ERRORS
+    print("=== Multi-Agent Proposal Review ===")
+    if not args.cache:
+        from .utils.llm_cache import disable_llm_cache
+        disable_llm_cache()
+    client = _get_client()
+    setup_observability()
+    output_dir = OUTPUT_DIR
+    agent_config = _parse_agents(args.agents) or None
+    lines = [
+        f"Proposal directory: {proposal_dir}",
+        f"Supporting docs directory: {supporting_dir}",
+        f"Solicitation directory: {solicitation_dir}",
+        f"Output directory: {output_dir}",
+        f"Agent configuration: {agent_config}",
+        f"Document processing flag: {args.process_docs}",
+        f"Batch mode: {args.batch_mode}",
+        f"LLM response cache: {'Enabled' if args.cache else 'Bypassed'}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     workflow = ReviewWorkflow(
         client,
         agent_config,
         proposal_dir=proposal_dir,
         supporting_dir=supporting_dir,
         solicitation_dir=solicitation_dir,
-        should_process_docs=args.process_docs
+        should_process_docs=args.process_docs,
+        batch_mode=args.batch_mode
     )
-    # Generate workflow visualization BEFORE running the review
+    # The diagram only depends on the agent list, so render it in a worker thread while the review runs
     print("Generating workflow visualization...")
-    try:
-        png_file = create_workflow_visualization(workflow.agent_config, output_dir)
-        if png_file:
-            print(f"Workflow visualization saved: {png_file}")
-        else:
-            print("Workflow visualization failed")
-    except Exception as e:
-        print(f"Workflow visualization failed: {e}")
+    visualization = asyncio.create_task(
+        asyncio.to_thread(create_workflow_visualization, workflow.agent_config, output_dir)
+    )
     print("Starting review workflow...")
     try:
         print("Starting workflow execution")
@@ -70,27 +216,32 @@ async def run_review_command(args):
         if final_state.processing_error:
             print(f"Review workflow failed: {final_state.processing_error}")
             sys.exit(1)
-        output_formatter = OutputFormatter()
-        for agent_id in workflow.agent_config:
-            agent_output = final_state.agent_outputs.get(agent_id, None)
-            if agent_output:
-                output_formatter.save_agent_feedback(agent_output, output_dir)
-        if final_state.summary:
-            output_formatter.save_summary(final_state.summary, output_dir)
-        if final_state.action_items:
-            output_formatter.save_action_items(final_state.action_items, output_dir)
-        print("Multi-agent review completed successfully")
-        print(f"  - Output directory: {output_dir}")
-        print(f"  - Agents used: {', '.join(workflow.agent_config)}")
-        print(f"  - Document processing: {'Enabled' if args.process_docs else 'Skipped'}")
+        # Output files are independent, so write them concurrently off the event loop
+        await OutputFormatter(executor=_IO_POOL).asave_all_outputs(final_state)
+        lines = [
+            "Multi-agent review completed successfully",
+            f"  - Output directory: {output_dir}",
+            f"  - Agents used: {', '.join(workflow.agent_config)}",
+            f"  - Document processing: {'Enabled' if args.process_docs else 'Skipped'}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+    except RETRYABLE_ERRORS as e:
+        # Agent calls already retried with backoff, so this is a persistent API problem
+        logging.getLogger("cli").error(f"LLM API unavailable after retries: {e}")
+        print(f"\u2717 Review workflow failed: LLM API unavailable after retries ({type(e).__name__}): {e}")
+        sys.exit(1)
     except Exception as e:
-        print(f"Review workflow failed: {e}", exc_info=True)
+        logging.getLogger("cli").error(f"Review workflow failed: {e}", exc_info=True)
         print(f"\u2717 Review workflow failed: {e}")
         sys.exit(1)
+    finally:
+        # Reported after the outputs are saved; runs on every exit path so the task is always retrieved
+        await _report_visualization(visualization)
 
 
-def main():
-    """Minimal CLI entry point for multi-agent proposal review."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process."""
     parser = argparse.ArgumentParser(
         description="Multi-agent proposal review system (minimal CLI)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -99,6 +250,7 @@ Examples:
   poetry run review                                    # Run with all agents
   poetry run review --agents tech_lead,panel_scorer   # Run with specific agents
   poetry run review --no-process-docs                 # Skip document processing
+  poetry run review --batch-mode                      # Offline review via the Batch API
         """
     )
     parser.add_argument("--proposal-dir", default="documents/proposal", help="Directory containing main proposal PDF")
@@ -107,9 +259,20 @@ Examples:
     parser.add_argument("--agents", help="Comma-separated list of agents to use (e.g., tech_lead,business_strategist)")
     parser.add_argument("--process-docs", action="store_true", default=True, help="Process documents (default: True)")
     parser.add_argument("--no-process-docs", dest="process_docs", action="store_false", help="Skip document processing (use cached processed documents)")
-    args = parser.parse_args()
-    import asyncio
-    asyncio.run(run_review_command(args))
+    parser.add_argument("--no-cache", dest="cache", action="store_false", help="Bypass the LLM response cache for this run")
+    parser.add_argument("--batch-mode", action="store_true", help="Submit agent reviews through the OpenAI Batch API (slower, roughly half the token cost)")
+    return parser
+
+
+def main(argv=None):
+    """Minimal CLI entry point for multi-agent proposal review."""
+    args = _build_parser().parse_args(argv)
+    load_env_once()
+    setup_logging()
+    script_name = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+    cli_args = sys.argv[1:] if argv is None else argv
+    logging.getLogger("cli").info(f"CLI command executed: {' '.join([script_name, *cli_args])}")
+    _run(run_review_command(args))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -5,15 +5,345 @@ Supports PDF, CSV, and MD files with OCR and LLM processing.
 
 import logging
 import csv
-import json
+import hashlib
 import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
-from dotenv import load_dotenv
-from marker.converters.pdf import PdfConverter
-from marker.models import create_model_dict
-from marker.output import text_from_rendered
-from marker.services.openai import OpenAIService
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+
+from ..utils import json_io
+from ..utils.config_loader import get_config_loader
+from ..utils.env import load_env_once
+from .file_discovery import FileDiscovery
+
+if TYPE_CHECKING:
+    from marker.converters.pdf import PdfConverter
+
+# Marker (and the torch stack behind it) is imported on first PDF conversion,
+# so runs over Markdown/CSV only never load it
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file's bytes, reusing the digest while its size and mtime are unchanged."""
+    st = os.stat(path)
+    return _sha256_for(str(path), st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _sha256_for(path: str, size: int, mtime_ns: int) -> str:
+    # size/mtime are part of the key so an edited file is re-hashed
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _source_fingerprint(path: Path) -> Tuple[int, Optional[str]]:
+    """(size, sha256) of a source file from a single stat, or (0, None) if it is gone."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return 0, None
+    return st.st_size, _sha256_for(str(path), st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _compress_processed_docs() -> bool:
+    """Whether processed sidecars are written as .json.zst (opt-in, needs zstandard)."""
+    try:
+        enabled = get_config_loader().get_output_config().get("compress_processed_docs", False)
+    except FileNotFoundError:
+        enabled = False
+    return bool(enabled) and json_io.zstandard is not None
+
+
+@lru_cache(maxsize=1)
+def _pretty_processed_docs() -> bool:
+    """Whether processed sidecars are indented for reading by hand (compact by default)."""
+    try:
+        return bool(get_config_loader().get_document_processing_config().get("pretty_json", False))
+    except FileNotFoundError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _content_store_dir() -> Optional[Path]:
+    """Shared directory of processed documents named by source sha256, or None when disabled."""
+    try:
+        store = get_config_loader().get_document_processing_config().get("content_store", ".cache/processed")
+    except FileNotFoundError:
+        store = ".cache/processed"
+    return Path(store) if store else None
+
+
+def _content_store_path(source_sha: Optional[str]) -> Optional[Path]:
+    store = _content_store_dir()
+    if store is None or not source_sha:
+        return None
+    return store / f"{source_sha}.json"
+
+
+def _content_store_copies(items: List[Tuple[Path, Dict[str, Any]]]) -> List[Tuple[Path, Dict[str, Any]]]:
+    """Content-store entries mirroring the given sidecars, so renamed or moved files are found by digest."""
+    copies = []
+    for _, saved_doc in items:
+        store_path = _content_store_path(saved_doc.get("source_sha256"))
+        if store_path is not None:
+            _ensure_dir(store_path.parent)
+            copies.append((store_path, saved_doc))
+    return copies
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file stripped of surrounding whitespace, with CRLF and CR newlines normalized."""
+    # One bulk read and decode; strip the bytes so only one str is built
+    raw = path.read_bytes().strip()
+    if b"\r" in raw:
+        # Match the newline translation text-mode reads used to do
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw.decode('utf-8')
+
+
+def _compressed_path(path: Path) -> Path:
+    return path.with_name(path.name + ".zst")
+
+
+def read_processed_json(path: Path) -> Any:
+    """Read a processed-document sidecar, preferring its .zst variant when zstandard is available."""
+    if json_io.zstandard is not None:
+        try:
+            with open(_compressed_path(path), "rb") as f:
+                return json_io.loads(json_io.decompress(f.read()))
+        except FileNotFoundError:
+            pass
+    with open(path, "rb") as f:
+        return json_io.loads(f.read())
+
+
+def processed_json_stamp(path: Path) -> Tuple:
+    """(mtime_ns, size) of each file read_processed_json may read for ``path``; None for a missing one."""
+    stamps = []
+    for candidate in (_compressed_path(path), path):
+        try:
+            st = candidate.stat()
+            stamps.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+# Directories already created this process; all processor instances share it
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path: Path):
+    """mkdir a directory once per process instead of on every save call."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> Path:
+    """Write JSON to a temp file and rename it so readers never see a partial file; returns the path written."""
+    payload = json_io.dumps(data, indent=_pretty_processed_docs())
+    stale_path = _compressed_path(path)
+    if _compress_processed_docs():
+        payload = json_io.compress(payload)
+        path, stale_path = stale_path, path
+    # Per-writer temp name: identical documents share one content-store path and may be written concurrently
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Drop the other format so read_processed_json cannot pick up an older copy
+    stale_path.unlink(missing_ok=True)
+    return path
+
+
+def _write_json_files(items: List[Tuple[Path, Dict[str, Any]]]) -> List[Path]:
+    """Serialize and write several JSON files concurrently; file I/O and orjson release the GIL."""
+    if len(items) < 2:
+        return [_write_json_atomic(path, data) for path, data in items]
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        # list() re-raises the first write error, as the sequential loop did
+        return list(executor.map(lambda item: _write_json_atomic(*item), items))
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_converter(config_items: Tuple[Tuple[str, Any], ...]) -> "PdfConverter":
+    """Load the Marker models once and build a converter for the given OpenAI config."""
+    from marker.converters.pdf import PdfConverter
+    from marker.models import create_model_dict
+    converter = PdfConverter(
+        artifact_dict=create_model_dict(),
+        llm_service="marker.services.openai.OpenAIService",
+        config=dict(config_items)
+    )
+    logging.getLogger(__name__).info("Marker converter initialized successfully with OpenAI LLM")
+    return converter
+
+
+def _prefetch_file(path: str):
+    """Ask the kernel to read a file ahead sequentially before Marker opens it (POSIX only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def _fast_pdf_settings() -> Tuple[bool, int]:
+    """(enabled, min_chars_per_page) for the text-layer PDF fast path."""
+    try:
+        config = get_config_loader().get_document_processing_config()
+    except FileNotFoundError:
+        config = {}
+    return bool(config.get("fast_text_pdf", False)), int(config.get("min_chars_per_page", 200))
+
+
+def _fast_pdf_text(path: Path) -> Optional[str]:
+    """Return the PDF's embedded text layer if it is dense enough to skip Marker, else None."""
+    enabled, min_chars_per_page = _fast_pdf_settings()
+    if not enabled:
+        return None
+    try:
+        # pypdfium2 ships with marker-pdf
+        import pypdfium2
+        pdf = pypdfium2.PdfDocument(str(path))
+    except Exception:
+        return None
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    except Exception:
+        return None
+    finally:
+        pdf.close()
+    text = "\n\n".join(pages)
+    # Scanned PDFs have little or no text layer and still need OCR
+    if not pages or len(text.strip()) / len(pages) < min_chars_per_page:
+        return None
+    return text
+
+
+def _pdf_workers() -> int:
+    """Number of processes for PDF conversion; each loads its own Marker models, so default to 1."""
+    workers = os.getenv("PROPOSAL_GRADER_PDF_WORKERS")
+    if workers is None:
+        try:
+            workers = get_config_loader().get_document_processing_config().get("pdf_workers", 1)
+        except FileNotFoundError:
+            workers = 1
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        logging.getLogger(__name__).warning(f"Ignoring invalid PDF worker count {workers!r}; using 1")
+        workers = 1
+    return max(1, min(workers, os.cpu_count() or 1))
+
+
+# Serializes Marker use (in-process converter and worker pools) across threads
+_MARKER_LOCK = threading.Lock()
+
+# Per-process converter for PDF worker processes, built once by _init_pdf_worker
+_WORKER_CONVERTER = None
+
+
+def _init_pdf_worker(openai_config: Dict[str, Any]):
+    global _WORKER_CONVERTER
+    _WORKER_CONVERTER = _get_pdf_converter(tuple(sorted(openai_config.items())))
+
+
+def _pdf_worker(path_str: str) -> Tuple[str, int]:
+    """Convert one PDF in a worker process and return its markdown and image count."""
+    from marker.output import text_from_rendered
+    _prefetch_file(path_str)
+    md_text, _, images = text_from_rendered(_WORKER_CONVERTER(path_str))
+    return md_text, len(images) if images else 0
+
+
+# ATX heading line: 1-6 '#' followed by whitespace or end of line ("#tag" and "#1" are body text)
+_HEADING_RE = re.compile(r'^(#{1,6})(?:[ \t]+(.*))?$', re.MULTILINE)
+
+
+def extract_sections_from_markdown(markdown_content: str) -> List[Dict[str, Any]]:
+    """Extract sections from markdown content."""
+    # One C-level split yields [preamble, hashes, title, body, hashes, title, body, ...];
+    # text before the first heading is not part of any section
+    parts = _HEADING_RE.split(markdown_content)
+    return [
+        {
+            'title': (title or '').strip(),
+            'level': len(hashes),
+            'content': body.strip()
+        }
+        for hashes, title, body in zip(parts[1::3], parts[2::3], parts[3::3])
+    ]
+
+
+def build_sections(processed_with: str, full_text: str) -> List[Dict[str, Any]]:
+    """Derive a document's sections from its full text."""
+    if processed_with == "csv_processor":
+        return [{"title": "CSV Data", "content": full_text, "level": 1}]
+    if processed_with == "md_processor":
+        return [{"title": "Markdown Document", "content": full_text, "level": 1}]
+    if processed_with == "txt_processor":
+        return [{"title": "Text Document", "content": full_text, "level": 1}]
+    if processed_with == "pdfium_text":
+        return [{"title": "PDF Text", "content": full_text, "level": 1}]
+    return extract_sections_from_markdown(full_text)
+
+
+def _persisted_content(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop sections before saving; they repeat full_text and are rebuilt on load."""
+    return {key: value for key, value in doc.items() if key != "sections"}
+
+
+def restore_sections(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild sections for cached content saved without them (older caches still carry them)."""
+    if "sections" not in content and "full_text" in content:
+        content["sections"] = build_sections(content.get("processed_with"), content["full_text"])
+    return content
+
+
+def load_from_content_store(original_path: Path, doc_type: str, source_sha: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Content of a document processed from identical bytes under another name or folder, else None."""
+    store_path = _content_store_path(source_sha or file_sha256(original_path))
+    if store_path is None:
+        return None
+    try:
+        stored = read_processed_json(store_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Failed to load content-store entry {store_path}: {e}")
+        return None
+    if not stored or stored.get("source_sha256") != store_path.stem:
+        return None
+    content = restore_sections(stored["content"])
+    # The stored entry describes whichever path was processed first
+    content["file_path"] = str(original_path)
+    content["file_name"] = original_path.name
+    content["type"] = doc_type
+    return content
 
 
 class DocumentProcessor:
@@ -21,15 +351,17 @@ class DocumentProcessor:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.openai_config = None
+        # (text, image count, processed_with) converted ahead of time by _prerender_pdfs, keyed by path
+        self._prerendered: Dict[str, Tuple[str, int, str]] = {}
         
         # Load environment variables from .env file
-        load_dotenv()
+        load_env_once()
         
-        # Initialize Marker converter with OpenAI LLM enhancement
+        # Prepare the OpenAI config for Marker; the converter itself loads on first PDF
         try:
             # Load configuration
-            from ..utils.config_loader import ConfigLoader
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
             llm_config = config_loader.get_llm_config("document_processing")
             
             # Create config for OpenAIService
@@ -40,20 +372,26 @@ class DocumentProcessor:
                 "openai_image_format": "png"
             }
             
-            # Create OpenAI service for LLM enhancement with proper configuration
-            self.openai_service = OpenAIService(config=openai_config)
-            self.logger.info("OpenAIService created successfully")
+            # Marker's LLM processors fan their per-block requests out up to this many at once
+            max_concurrency = config_loader.get_document_processing_config().get("llm_max_concurrency")
+            if max_concurrency:
+                openai_config["max_concurrency"] = int(max_concurrency)
             
-            # Initialize Marker converter with LLM service using config
-            self.converter = PdfConverter(
-                artifact_dict=create_model_dict(),
-                llm_service="marker.services.openai.OpenAIService",
-                config=openai_config
-            )
-            self.logger.info("Marker converter initialized successfully with OpenAI LLM")
+            # The converter builds its own OpenAIService from this config
+            self.openai_config = openai_config
+        except Exception as e:
+            self.logger.error(f"Failed to configure Marker OpenAI service: {e}")
+    
+    @property
+    def converter(self):
+        """Marker converter, loaded on first PDF and shared by every processor in the process."""
+        if self.openai_config is None:
+            return None
+        try:
+            return _get_pdf_converter(tuple(sorted(self.openai_config.items())))
         except Exception as e:
             self.logger.error(f"Failed to initialize Marker converter: {e}")
-            self.converter = None
+            return None
     
     def _get_processed_document_path(self, original_path: Path, doc_type: str) -> Path:
         """Get the path for a processed document."""
@@ -71,20 +409,49 @@ class DocumentProcessor:
             return processed_dir / f"{base_name}_processed.json"
     
     def _load_processed_document(self, processed_path: Path) -> Dict[str, Any]:
-        """Load a processed document from JSON."""
+        """Load a processed document from JSON, or None if it is missing or unreadable."""
         try:
-            with open(processed_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.logger.info(f"Loaded processed document: {list(data.keys()) if data else 'None'}")
-                return data
+            data = read_processed_json(processed_path)
+            self.logger.info(f"Loaded processed document: {list(data.keys()) if data else 'None'}")
+            return data
+        except FileNotFoundError:
+            # A miss is the normal case for new documents; no separate exists() probe needed
+            return None
         except Exception as e:
             self.logger.warning(f"Failed to load processed document {processed_path}: {e}")
             return None
     
-    def _is_document_processed(self, original_path: Path, doc_type: str) -> bool:
-        """Check if a document has already been processed."""
+    def _load_cached_docs(self, file_paths: List[Path], doc_type: str) -> Dict[Path, Dict[str, Any]]:
+        """Probe the processed-document cache for many files at once (hashing and reads release the GIL)."""
+        if len(file_paths) < 2:
+            return {p: self._load_current_processed_document(p, doc_type) for p in file_paths}
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            docs = executor.map(lambda p: self._load_current_processed_document(p, doc_type), file_paths)
+            return dict(zip(file_paths, docs))
+    
+    def _load_current_processed_document(self, original_path: Path, doc_type: str) -> Dict[str, Any]:
+        """Return the cached processed content if it was built from the file's current bytes, else None."""
         processed_path = self._get_processed_document_path(original_path, doc_type)
-        return processed_path.exists()
+        processed_data = self._load_processed_document(processed_path)
+        current_sha = None
+        if processed_data:
+            # Entries written before content hashing have no digest and are trusted as-is
+            cached_sha = processed_data.get("source_sha256")
+            if cached_sha:
+                current_sha = file_sha256(original_path)
+            if not cached_sha or cached_sha == current_sha:
+                self.logger.info(f"Using cached processed document: {original_path.name}")
+                # Extract the standardized structure from the cached wrapper
+                return restore_sections(processed_data["content"])
+            self.logger.info(f"Source changed since processing: {original_path.name}")
+        return self._load_from_content_store(original_path, doc_type, current_sha or file_sha256(original_path))
+    
+    def _load_from_content_store(self, original_path: Path, doc_type: str, source_sha: str) -> Dict[str, Any]:
+        """Reuse a document processed from identical bytes under another name or folder, else None."""
+        content = load_from_content_store(original_path, doc_type, source_sha)
+        if content is not None:
+            self.logger.info(f"Using processed document with identical content: {original_path.name}")
+        return content
     
     def _process_document_unified(self, file_path: Path, doc_type: str) -> Dict[str, Any]:
         """Unified document processing method for all document types."""
@@ -100,6 +467,8 @@ class DocumentProcessor:
                 return self._process_csv_document(file_path, doc_type)
             elif ext == '.md':
                 return self._process_md_document(file_path, doc_type)
+            elif ext == '.txt':
+                return self._process_txt_document(file_path, doc_type)
             else:
                 raise ValueError(f"Unsupported file type: {ext}")
                 
@@ -109,12 +478,27 @@ class DocumentProcessor:
     
     def _process_pdf_document(self, file_path: Path, doc_type: str) -> Dict[str, Any]:
         """Process PDF documents using Marker with LLM enhancement."""
-        if not self.converter:
-            raise RuntimeError("Marker converter not initialized")
-        
-        # Process PDF with OCR and LLM
-        rendered = self.converter(str(file_path))
-        md_text, _, images = text_from_rendered(rendered)
+        prerendered = self._prerendered.pop(str(file_path), None)
+        if prerendered is None:
+            fast_text = _fast_pdf_text(file_path)
+            if fast_text is not None:
+                prerendered = (fast_text, 0, "pdfium_text")
+        if prerendered is not None:
+            md_text, images_count, processed_with = prerendered
+        else:
+            from marker.output import text_from_rendered
+            processed_with = "marker_pdf_ocr"
+            # Document groups may be processed from several threads; Marker runs one PDF at a time
+            with _MARKER_LOCK:
+                converter = self.converter
+                if not converter:
+                    raise RuntimeError("Marker converter not initialized")
+                
+                # Process PDF with OCR and LLM
+                _prefetch_file(str(file_path))
+                rendered = converter(str(file_path))
+            md_text, _, images = text_from_rendered(rendered)
+            images_count = len(images) if images else 0
         
         # Validate that we got actual content
         if not md_text or md_text.strip() == "":
@@ -126,28 +510,45 @@ class DocumentProcessor:
             "file_name": file_path.name,
             "format": ".pdf",
             "type": doc_type,
-            "processed_with": "marker_pdf_ocr",
-            "sections": self._extract_sections_from_markdown(md_text),
-            "metadata": {"format": "pdf", "processed_with": "marker_pdf_ocr"},
-            "images_count": len(images) if images else 0
+            "processed_with": processed_with,
+            "sections": build_sections(processed_with, md_text),
+            "metadata": {"format": "pdf", "processed_with": processed_with},
+            "images_count": images_count
         }
     
+    def _prerender_pdfs(self, pdf_paths: List[Path]):
+        """Convert PDFs across a process pool when PROPOSAL_GRADER_PDF_WORKERS > 1."""
+        # Text-layer PDFs never need Marker; keep only the ones that do for the pool
+        remaining = []
+        for path in pdf_paths:
+            fast_text = _fast_pdf_text(path)
+            if fast_text is not None:
+                self._prerendered[str(path)] = (fast_text, 0, "pdfium_text")
+            else:
+                remaining.append(path)
+        pdf_paths = remaining
+        workers = min(_pdf_workers(), len(pdf_paths))
+        if workers < 2 or self.openai_config is None:
+            return
+        self.logger.info(f"Converting {len(pdf_paths)} PDFs with {workers} worker processes")
+        try:
+            # One pool at a time, so concurrent callers don't each load `workers` copies of the models
+            with _MARKER_LOCK, ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker,
+                                     initargs=(self.openai_config,)) as executor:
+                for path, result in zip(pdf_paths, executor.map(_pdf_worker, [str(p) for p in pdf_paths])):
+                    self._prerendered[str(path)] = (*result, "marker_pdf_ocr")
+        except Exception as e:
+            # Anything not converted falls back to the in-process converter
+            self.logger.warning(f"Parallel PDF conversion failed, continuing serially: {e}")
+    
     def _process_csv_document(self, file_path: Path, doc_type: str) -> Dict[str, Any]:
         """Process CSV documents to readable text format."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-        
-        # Convert CSV to readable text format
-        text_lines = []
-        for i, row in enumerate(rows):
-            if i == 0:  # Header row
-                text_lines.append(" | ".join(row))
-                text_lines.append("-" * len(" | ".join(row)))
-            else:
-                text_lines.append(" | ".join(row))
-        
-        csv_text = "\n".join(text_lines)
+        # Convert CSV to readable text format, joining each row once as it streams in
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            rows = map(" | ".join, csv.reader(f))
+            header = next(rows, None)
+            # Underline the header row; the body rows are joined straight from the reader
+            csv_text = "" if header is None else "\n".join([header, "-" * len(header), *rows])
         
         # Validate that we got actual content
         if not csv_text or csv_text.strip() == "":
@@ -160,18 +561,17 @@ class DocumentProcessor:
             "format": ".csv",
             "type": doc_type,
             "processed_with": "csv_processor",
-            "sections": [{"title": "CSV Data", "content": csv_text, "level": 1}],
+            "sections": build_sections("csv_processor", csv_text),
             "metadata": {"format": "csv", "processed_with": "csv_processor"},
             "images_count": 0
         }
     
     def _process_md_document(self, file_path: Path, doc_type: str) -> Dict[str, Any]:
         """Process Markdown documents."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
+        content = _read_text(file_path)
         
         # Validate that we got actual content
-        if not content or content.strip() == "":
+        if not content:
             raise RuntimeError(f"Markdown processing failed for {file_path.name}: file is empty")
         
         return {
@@ -181,50 +581,36 @@ class DocumentProcessor:
             "format": ".md",
             "type": doc_type,
             "processed_with": "md_processor",
-            "sections": [{"title": "Markdown Document", "content": content, "level": 1}],
+            "sections": build_sections("md_processor", content),
             "metadata": {"format": "md", "processed_with": "md_processor"},
             "images_count": 0
         }
-
     
-    def _extract_sections_from_markdown(self, markdown_content: str) -> List[Dict[str, Any]]:
-        """Extract sections from markdown content."""
-        sections = []
-        lines = markdown_content.split('\n')
-        current_section = None
-        current_content = []
+    def _process_txt_document(self, file_path: Path, doc_type: str) -> Dict[str, Any]:
+        """Process plain-text documents."""
+        content = _read_text(file_path)
         
-        for line in lines:
-            if line.startswith('#'):
-                # Save previous section if exists
-                if current_section:
-                    current_section['content'] = '\n'.join(current_content).strip()
-                    sections.append(current_section)
-                
-                # Start new section
-                level = len(line) - len(line.lstrip('#'))
-                title = line.lstrip('#').strip()
-                current_section = {
-                    'title': title,
-                    'level': level,
-                    'content': ''
-                }
-                current_content = []
-            else:
-                current_content.append(line)
-        
-        # Add final section
-        if current_section:
-            current_section['content'] = '\n'.join(current_content).strip()
-            sections.append(current_section)
+        # Validate that we got actual content
+        if not content:
+            raise RuntimeError(f"Text processing failed for {file_path.name}: file is empty")
         
-        return sections
+        return {
+            "full_text": content,
+            "file_path": str(file_path),
+            "file_name": file_path.name,
+            "format": ".txt",
+            "type": doc_type,
+            "processed_with": "txt_processor",
+            "sections": build_sections("txt_processor", content),
+            "metadata": {"format": "txt", "processed_with": "txt_processor"},
+            "images_count": 0
+        }
     
     def _save_processed_document(self, original_path: Path, processed_data: Dict[str, Any], doc_type: str):
         """Save processed document to JSON file."""
         try:
             processed_dir = original_path.parent / "processed"
-            processed_dir.mkdir(exist_ok=True)
+            _ensure_dir(processed_dir)
             
             base_name = original_path.stem
             if doc_type == "supporting":
@@ -235,19 +621,22 @@ class DocumentProcessor:
                 processed_path = processed_dir / f"{base_name}_processed.json"
             
             # Create wrapper structure for saved file
+            file_size, source_sha = _source_fingerprint(original_path)
             saved_doc = {
                 "original_file": str(original_path),
                 "processed_at": str(Path.cwd()),
                 "format": original_path.suffix,
-                "content": processed_data,  # Store the standardized structure under 'content'
-                "file_size_bytes": original_path.stat().st_size if original_path.exists() else 0,
+                "content": _persisted_content(processed_data),  # Store the standardized structure under 'content'
+                "file_size_bytes": file_size,
+                "source_sha256": source_sha,
                 "type": f"{doc_type}_document",
                 "processed_with": processed_data.get("processed_with"),
                 "images_count": processed_data.get("images_count", 0)
             }
             
-            with open(processed_path, "w", encoding="utf-8") as f:
-                json.dump(saved_doc, f, indent=2, ensure_ascii=False)
+            processed_path = _write_json_atomic(processed_path, saved_doc)
+            for store_path, store_doc in _content_store_copies([(processed_path, saved_doc)]):
+                _write_json_atomic(store_path, store_doc)
             
             self.logger.info(f"Saved processed document to: {processed_path}")
             
@@ -258,14 +647,10 @@ class DocumentProcessor:
         """Process main proposal document using unified method."""
         self.logger.info(f"Processing main proposal: {proposal_path}")
         
-        # Check if already processed
-        if self._is_document_processed(proposal_path, "proposal"):
-            self.logger.info(f"Using cached processed document: {proposal_path.name}")
-            processed_path = self._get_processed_document_path(proposal_path, "proposal")
-            processed_data = self._load_processed_document(processed_path)
-            if processed_data:
-                # Extract the standardized structure from the cached wrapper
-                return processed_data["content"]
+        # Reuse the processed document unless the source bytes changed
+        cached = self._load_current_processed_document(proposal_path, "proposal")
+        if cached is not None:
+            return cached
         
         # Process with unified method
         doc_data = self._process_document_unified(proposal_path, "proposal")
@@ -281,11 +666,8 @@ class DocumentProcessor:
             self.logger.warning(f"Supporting docs directory not found: {supporting_dir}")
             return []
 
-        # Find all supported files (including sub-folders)
-        supported_extensions = ['.pdf', '.txt', '.md', '.csv']
-        all_files = []
-        for ext in supported_extensions:
-            all_files.extend(list(supporting_dir.rglob(f"*{ext}")))
+        # Find all supported files (including sub-folders) in a single walk
+        all_files = FileDiscovery().find_supporting_docs(supporting_dir)
 
         if not all_files:
             self.logger.warning(f"No supporting documents found in {supporting_dir}")
@@ -294,28 +676,24 @@ class DocumentProcessor:
         self.logger.info(f"Processing {len(all_files)} supporting documents")
 
         supporting_docs = []
-        needs_processing = False
-
-        for file_path in all_files:
-            # Check if already processed
-            if self._is_document_processed(file_path, "supporting"):
-                self.logger.info(f"Using cached processed document: {file_path.name}")
-                processed_path = self._get_processed_document_path(file_path, "supporting")
-                processed_data = self._load_processed_document(processed_path)
-                if processed_data:
-                    # Extract the standardized structure from the cached wrapper
-                    doc_data = processed_data["content"]
+
+        # Reuse processed documents unless the source bytes changed
+        cached_docs = self._load_cached_docs(all_files, "supporting")
+        self._prerender_pdfs([p for p, doc in cached_docs.items() if doc is None and p.suffix.lower() == ".pdf"])
+
+        # Save each new document in the background while the next one is processed;
+        # leaving the with-block waits for outstanding saves. Cached ones are already on disk.
+        with ThreadPoolExecutor(max_workers=2) as save_pool:
+            for file_path in all_files:
+                doc_data = cached_docs[file_path]
+                if doc_data is not None:
                     supporting_docs.append(doc_data)
                     continue
-            
-            needs_processing = True
-            self.logger.info(f"Processing supporting document: {file_path.name}")
-            doc_data = self._process_document_unified(file_path, "supporting")
-            supporting_docs.append(doc_data)
-
-        # Save processed supporting documents only if we processed new ones
-        if needs_processing:
-            self._save_processed_supporting_docs(supporting_docs, supporting_dir)
+                
+                self.logger.info(f"Processing supporting document: {file_path.name}")
+                doc_data = self._process_document_unified(file_path, "supporting")
+                supporting_docs.append(doc_data)
+                save_pool.submit(self._save_processed_supporting_docs, [doc_data], supporting_dir)
 
         return supporting_docs
     
@@ -323,28 +701,33 @@ class DocumentProcessor:
         """Save processed supporting documents as individual files."""
         try:
             processed_dir = supporting_dir.parent / "processed"
-            processed_dir.mkdir(exist_ok=True)
+            _ensure_dir(processed_dir)
             
+            processed_at = str(Path.cwd())
+            pending = []
             for doc in supporting_docs:
                 # Create individual processed file for each supporting document
                 original_path = Path(doc["file_path"])
                 base_name = original_path.stem
                 processed_path = processed_dir / f"supporting_{base_name}_processed.json"
+                file_size, source_sha = _source_fingerprint(original_path)
                 
                 processed_doc = {
                     "original_file": doc["file_path"],
-                    "processed_at": str(Path.cwd()),
+                    "processed_at": processed_at,
                     "format": doc.get("format"),
-                    "content": doc,
-                    "file_size_bytes": original_path.stat().st_size if original_path.exists() else 0,
+                    "content": _persisted_content(doc),
+                    "file_size_bytes": file_size,
+                    "source_sha256": source_sha,
                     "type": "supporting_document",
                     "processed_with": doc.get("processed_with"),
                     "images_count": doc.get("images_count", 0)
                 }
                 
-                with open(processed_path, "w", encoding="utf-8") as f:
-                    json.dump(processed_doc, f, indent=2, ensure_ascii=False)
-                
+                pending.append((processed_path, processed_doc))
+            
+            written = _write_json_files(pending + _content_store_copies(pending))
+            for processed_path in written[:len(pending)]:
                 self.logger.info(f"Saved processed supporting document to: {processed_path}")
             
         except Exception as e:
@@ -357,38 +740,32 @@ class DocumentProcessor:
 
         self.logger.info(f"Processing solicitation documents from: {solicitation_dir}")
 
-        # Import file discovery to find documents
-        from .file_discovery import FileDiscovery
+        # Find documents by type
         file_discovery = FileDiscovery()
         solicitation_files = file_discovery.find_solicitation_docs(solicitation_dir)
 
         # Process each file type
         all_docs = []
-        needs_processing = False
 
         # Process all files with Marker
         all_files = solicitation_files["csv"] + solicitation_files["md"] + solicitation_files["pdf"]
         
-        for file_path in all_files:
-            # Check if already processed
-            if self._is_document_processed(file_path, "solicitation"):
-                self.logger.info(f"Using cached processed document: {file_path.name}")
-                processed_path = self._get_processed_document_path(file_path, "solicitation")
-                processed_data = self._load_processed_document(processed_path)
-                if processed_data:
-                    # Extract the standardized structure from the cached wrapper
-                    doc_data = processed_data["content"]
+        # Reuse processed documents unless the source bytes changed
+        cached_docs = self._load_cached_docs(all_files, "solicitation")
+        self._prerender_pdfs([p for p, doc in cached_docs.items() if doc is None and p.suffix.lower() == ".pdf"])
+
+        # Save each new document in the background while the next one is processed
+        with ThreadPoolExecutor(max_workers=2) as save_pool:
+            for file_path in all_files:
+                doc_data = cached_docs[file_path]
+                if doc_data is not None:
                     all_docs.append(doc_data)
                     continue
-            
-            needs_processing = True
-            self.logger.info(f"Processing solicitation document: {file_path.name}")
-            doc_data = self._process_document_unified(file_path, "solicitation")
-            all_docs.append(doc_data)
-
-        # Save processed solicitation documents only if we processed new ones
-        if needs_processing:
-            self._save_processed_solicitation_docs(all_docs, solicitation_dir)
+                
+                self.logger.info(f"Processing solicitation document: {file_path.name}")
+                doc_data = self._process_document_unified(file_path, "solicitation")
+                all_docs.append(doc_data)
+                save_pool.submit(self._save_processed_solicitation_docs, [doc_data], solicitation_dir)
 
         return {
             "solicitation_documents": all_docs,
@@ -399,28 +776,33 @@ class DocumentProcessor:
         """Save processed solicitation documents as individual files."""
         try:
             processed_dir = solicitation_dir / "processed"
-            processed_dir.mkdir(exist_ok=True)
+            _ensure_dir(processed_dir)
             
+            processed_at = str(Path.cwd())
+            pending = []
             for doc in solicitation_docs:
                 # Create individual processed file for each solicitation document
                 original_path = Path(doc["file_path"])
                 base_name = original_path.stem
                 processed_path = processed_dir / f"solicitation_{base_name}_processed.json"
+                file_size, source_sha = _source_fingerprint(original_path)
                 
                 processed_doc = {
                     "original_file": doc["file_path"],
-                    "processed_at": str(Path.cwd()),
+                    "processed_at": processed_at,
                     "format": doc.get("format"),
-                    "content": doc,
-                    "file_size_bytes": original_path.stat().st_size if original_path.exists() else 0,
+                    "content": _persisted_content(doc),
+                    "file_size_bytes": file_size,
+                    "source_sha256": source_sha,
                     "type": "solicitation_document",
                     "processed_with": doc.get("processed_with"),
                     "images_count": doc.get("images_count", 0)
                 }
                 
-                with open(processed_path, "w", encoding="utf-8") as f:
-                    json.dump(processed_doc, f, indent=2, ensure_ascii=False)
-                
+                pending.append((processed_path, processed_doc))
+            
+            written = _write_json_files(pending + _content_store_copies(pending))
+            for processed_path in written[:len(pending)]:
                 self.logger.info(f"Saved processed solicitation document to: {processed_path}")
             
         except Exception as e:
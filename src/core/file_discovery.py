@@ -6,8 +6,71 @@ Handles pattern matching and file validation with support for multiple formats.
 import logging
 import fnmatch
 import csv
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
+
+
+def _iter_file_entries(root: Path) -> Iterator[os.DirEntry]:
+    """Yield every file under ``root`` with os.scandir, in the same top-down order as ``Path.rglob``."""
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+        # Reversed so the first subdirectory is visited next (pre-order, like rglob)
+        stack.extend(reversed(subdirs))
+
+
+def scan_files_by_extension(root: Path, extensions: List[str]) -> Dict[str, List[Path]]:
+    """Walk ``root`` once and bucket files by (lower-cased) extension."""
+    found = {ext: [] for ext in extensions}
+    for entry in _iter_file_entries(root):
+        bucket = found.get(os.path.splitext(entry.name)[1].lower())
+        if bucket is not None:
+            bucket.append(Path(entry.path))
+    return found
+
+
+def _unique_real_paths(paths: Iterable[Path]) -> List[Path]:
+    """Drop paths that resolve to a file already listed (symlinked copies), keeping walk order."""
+    unique = []
+    seen = set()
+    for path in paths:
+        real_path = os.path.realpath(path)
+        if real_path not in seen:
+            seen.add(real_path)
+            unique.append(path)
+    return unique
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern_union(patterns: Tuple[str, ...]) -> "re.Pattern":
+    """One case-insensitive alternation of glob patterns, so each filename is matched once."""
+    # IGNORECASE rather than lower-casing every filename before matching
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), re.IGNORECASE)
+
+
+# Main proposal filename patterns (PDF only) in priority order, compiled once.
+# Case-insensitive, like the extension matching used for supporting and solicitation docs.
+_MAIN_PROPOSAL_PATTERNS = tuple(
+    re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+    for pattern in (
+        "main_proposal.pdf",
+        "*proposal*.pdf",
+        "*main*.pdf",
+        "*submission*.pdf",
+    )
+)
 
 
 class FileDiscovery:
@@ -15,6 +78,15 @@ class FileDiscovery:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Directory walks keyed by (root, extensions), so validate_file_structure followed by
+        # find_supporting_docs/find_solicitation_docs walks each tree once. Use a new instance to rescan.
+        self._scans: Dict[Tuple[str, Tuple[str, ...]], Dict[str, List[Path]]] = {}
+    
+    def _scan(self, root: Path, extensions: List[str]) -> Dict[str, List[Path]]:
+        key = (str(root), tuple(extensions))
+        if key not in self._scans:
+            self._scans[key] = scan_files_by_extension(root, extensions)
+        return self._scans[key]
     
     def find_main_proposal(self, proposal_dir: Path) -> Optional[Path]:
         """
@@ -24,20 +96,24 @@ class FileDiscovery:
             self.logger.error(f"Proposal directory not found: {proposal_dir}")
             return None
 
-        # Look for PDF files only
-        pdf_patterns = [
-            "main_proposal.pdf",
-            "*proposal*.pdf",
-            "*main*.pdf",
-            "*submission*.pdf",
-            "submission*.pdf"
-        ]
-
-        for pattern in pdf_patterns:
-            matches = list(proposal_dir.rglob(pattern))
-            if matches:
-                self.logger.info(f"Found main proposal: {matches[0]}")
-                return matches[0]
+        # Walk the tree once; the walk is in rglob order, so the first exact
+        # main_proposal.pdf seen is the answer and the rest of the tree is skipped
+        exact, *fallbacks = _MAIN_PROPOSAL_PATTERNS
+        pdf_files = []
+        for entry in _iter_file_entries(proposal_dir):
+            if not entry.name.lower().endswith(".pdf"):
+                continue
+            if exact.match(entry.name):
+                self.logger.info(f"Found main proposal: {entry.path}")
+                return Path(entry.path)
+            pdf_files.append(Path(entry.path))
+        
+        # Otherwise try the looser patterns in priority order against the listing
+        for pattern in fallbacks:
+            for pdf_path in pdf_files:
+                if pattern.match(pdf_path.name):
+                    self.logger.info(f"Found main proposal: {pdf_path}")
+                    return pdf_path
 
         self.logger.error(f"No main proposal found in {proposal_dir}")
         return None
@@ -48,12 +124,10 @@ class FileDiscovery:
             self.logger.warning(f"Supporting docs directory not found: {supporting_dir}")
             return []
 
-        # Find all supported files (including sub-folders)
+        # Find all supported files (including sub-folders) in a single walk
         supported_extensions = ['.pdf', '.txt', '.md', '.csv']
-        all_files = []
-        
-        for ext in supported_extensions:
-            all_files.extend(list(supporting_dir.rglob(f"*{ext}")))
+        by_ext = self._scan(supporting_dir, supported_extensions)
+        all_files = _unique_real_paths(path for ext in supported_extensions for path in by_ext[ext])
 
         self.logger.info(f"Found {len(all_files)} supporting documents")
         return all_files
@@ -67,17 +141,12 @@ class FileDiscovery:
             self.logger.warning(f"Solicitation directory not found: {solicitation_dir}")
             return {"csv": [], "md": [], "pdf": []}
         
-        # Find files by type (including sub-folders)
-        csv_files = list(solicitation_dir.rglob("*.csv"))
-        md_files = list(solicitation_dir.rglob("*.md"))
-        pdf_files = list(solicitation_dir.rglob("*.pdf"))
-        
-        # Also check supporting_docs subdirectory if it exists
-        supporting_docs_dir = solicitation_dir / "supporting_docs"
-        if supporting_docs_dir.exists():
-            csv_files.extend(list(supporting_docs_dir.rglob("*.csv")))
-            md_files.extend(list(supporting_docs_dir.rglob("*.md")))
-            pdf_files.extend(list(supporting_docs_dir.rglob("*.pdf")))
+        # Find files by type in one walk (sub-folders, including supporting_docs/, are covered)
+        by_ext = self._scan(solicitation_dir, [".csv", ".md", ".pdf"])
+        # Fresh lists, so callers can't modify the memoized walk
+        csv_files = _unique_real_paths(by_ext[".csv"])
+        md_files = _unique_real_paths(by_ext[".md"])
+        pdf_files = _unique_real_paths(by_ext[".pdf"])
         
         self.logger.info(f"Found solicitation documents: {len(csv_files)} CSV, {len(md_files)} MD, {len(pdf_files)} PDF")
         
@@ -132,11 +201,12 @@ class FileDiscovery:
     
     def find_files_by_patterns(self, root: Path, patterns: List[str]) -> List[Path]:
         """
-        Find files matching patterns in a directory tree.
+        Find files matching any of the (case-insensitive) patterns in a directory tree.
         """
-        found = []
-        for pattern in patterns:
-            for file_path in root.rglob("*"):
-                if file_path.is_file() and fnmatch.fnmatch(file_path.name.lower(), pattern.lower()):
-                    found.append(file_path)
-        return found 
\ No newline at end of file
+        if not patterns:
+            return []
+        union = _compile_pattern_union(tuple(patterns))
+        return [
+            Path(entry.path) for entry in _iter_file_entries(root)
+            if union.match(entry.name)
+        ] 
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Pools chat completions into a single OpenAI Batch API job for offline reviews.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+# Batch jobs end in one of these states; anything else is still queued or running
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchDispatcher:
+    """Collect chat completion requests issued close together and submit them as one batch job."""
+
+    def __init__(self, poll_interval: float = 30.0, gather_window: float = 1.0,
+                 client: Optional["AsyncOpenAI"] = None):
+        self.logger = logging.getLogger(__name__)
+        self.poll_interval = poll_interval
+        # Agents fan out concurrently, so a short window is enough to catch all of them
+        self.gather_window = gather_window
+        self._client = client
+        self._pending: Dict[str, tuple] = {}
+        self._flush_handle = None
+        # Strong references to running flushes; the event loop only keeps weak ones
+        self._flush_tasks = set()
+        self._ids = itertools.count()
+
+    @property
+    def client(self) -> "AsyncOpenAI":
+        if self._client is None:
+            # Imported on first use so importing this module stays cheap outside batch mode
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI()
+        return self._client
+
+    async def complete(self, label: str, body: Dict[str, Any]) -> str:
+        """Queue a /v1/chat/completions request body and return the message content once the batch finishes."""
+        loop = asyncio.get_running_loop()
+        custom_id = f"{label}-{next(self._ids)}"
+        future = loop.create_future()
+        self._pending[custom_id] = (body, future)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.gather_window, self._start_flush)
+        return await future
+
+    def _start_flush(self):
+        task = asyncio.ensure_future(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self):
+        """Submit everything queued so far as one batch and resolve each caller's future."""
+        pending, self._pending = self._pending, {}
+        self._flush_handle = None
+        try:
+            results = await self._run_batch({cid: body for cid, (body, _) in pending.items()})
+        except Exception as e:
+            for _, future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for custom_id, (_, future) in pending.items():
+            if future.done():
+                continue
+            if custom_id in results:
+                future.set_result(results[custom_id])
+            else:
+                future.set_exception(RuntimeError(f"Batch returned no result for {custom_id}"))
+
+    async def _run_batch(self, bodies: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Upload, create and poll one batch job; return message content keyed by custom_id."""
+        lines = [
+            json.dumps({"custom_id": cid, "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for cid, body in bodies.items()
+        ]
+        input_file = await self.client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self.logger.info(f"Submitted batch {batch.id} with {len(bodies)} requests")
+        while batch.status not in _TERMINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+            self.logger.info(f"Batch {batch.id} status: {batch.status}")
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        output = await self.client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                self.logger.error(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response}")
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return results
@@ -2,10 +2,12 @@
 Configuration loader for LLM settings and system parameters.
 """
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
+from . import json_io
+
 
 class ConfigLoader:
     """Load and manage system configuration."""
@@ -13,6 +15,7 @@ class ConfigLoader:
     def __init__(self, config_path: str = "config/system_config.json"):
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        self._llm_configs: Dict[str, Dict[str, Any]] = {}
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file."""
@@ -20,13 +23,16 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            # Bytes straight to the parser (orjson when installed), no text-mode decode pass
+            return json_io.loads(self.config_path.read_bytes())
         except Exception as e:
             raise RuntimeError(f"Could not load config from {self.config_path}: {e}")
     
     def get_llm_config(self, context: str = "default") -> Dict[str, Any]:
         """Get LLM configuration for a specific context."""
+        if context in self._llm_configs:
+            return self._llm_configs[context]
+        
         config = self.config.get("llm", {}).get(context, {})
         
         if not config:
@@ -37,15 +43,25 @@ class ConfigLoader:
         if "model" not in config:
             raise ValueError(f"No model specified for LLM context: {context}")
         
-        return {
+        llm_config = {
             "model": config["model"],
             "temperature": config.get("temperature", 0.5)  # Default temperature if not specified
         }
+        self._llm_configs[context] = llm_config
+        return llm_config
     
     def get_output_config(self) -> Dict[str, Any]:
         """Get output configuration."""
         return self.config.get("output", {})
     
+    def get_document_processing_config(self) -> Dict[str, Any]:
+        """Get document processing configuration."""
+        return self.config.get("document_processing", {})
+    
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get LLM response cache configuration."""
+        return self.config.get("cache", {})
+    
     def get_default_agents(self) -> list:
         """Get list of default agents."""
         return self.config.get("default_agents", [])
@@ -58,4 +74,10 @@ class ConfigLoader:
         for context in llm_configs.keys():
             contexts[context] = f"LLM configuration for {context}"
         
-        return contexts 
\ No newline at end of file
+        return contexts
+
+
+@lru_cache(maxsize=None)
+def get_config_loader(config_path: str = "config/system_config.json") -> ConfigLoader:
+    """Return a shared ConfigLoader so the config file is parsed once per process."""
+    return ConfigLoader(config_path)
@@ -0,0 +1,13 @@
+"""
+Process-wide .env loading shared by the CLI and the document processor.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def load_env_once():
+    """Load .env into the process environment once per process."""
+    # Imported on first call so importing this module stays cheap
+    from dotenv import load_dotenv
+    load_dotenv()
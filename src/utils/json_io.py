@@ -0,0 +1,66 @@
+"""
+JSON encode/decode helpers that use orjson when it is installed.
+"""
+
+import json
+import threading
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# simdjson parsers are not thread-safe; each thread reuses its own so buffers are not reallocated per file
+_SIMDJSON_LOCAL = threading.local()
+
+
+def _simdjson_parser():
+    parser = getattr(_SIMDJSON_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMDJSON_LOCAL.parser = simdjson.Parser()
+    return parser
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if simdjson is not None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        parsed = _simdjson_parser().parse(data)
+        # Materialize right away: the next parse() reuses the buffer this lazy view points into
+        if isinstance(parsed, simdjson.Object):
+            return parsed.as_dict()
+        if isinstance(parsed, simdjson.Array):
+            return parsed.as_list()
+        return parsed
+    return json.loads(data)
+
+
+def compress(data: bytes) -> bytes:
+    """zstd-compress ``data`` (requires the optional zstandard package)."""
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def decompress(data: bytes) -> bytes:
+    """Reverse :func:`compress`."""
+    return zstandard.ZstdDecompressor().decompress(data)
@@ -0,0 +1,95 @@
+"""
+Persistent SQLite cache for LLM responses keyed by request content.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config_loader import get_config_loader
+
+
+class LLMCache:
+    """Store LLM responses on disk so identical requests are not re-sent."""
+
+    def __init__(self, path: str = ".cache/llm_cache.sqlite", ttl_days: float = 30,
+                 max_entries: Optional[int] = None):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_days * 86400
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        if max_entries:
+            self._prune(max_entries)
+        self._conn.commit()
+
+    def _prune(self, max_entries: int):
+        """Drop the oldest entries beyond ``max_entries`` (done once per open, not per write)."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (max_entries,)
+        )
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], temperature: float) -> str:
+        """Build a cache key from the model, messages and temperature."""
+        payload = {"model": model, "messages": messages, "temperature": temperature}
+        # Compact separators keep the hashed payload small for long proposal prompts
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None on a miss or expired entry."""
+        row = self._conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        response, created_at = row
+        if self.ttl_seconds and time.time() - created_at > self.ttl_seconds:
+            return None
+        return response
+
+    def set(self, key: str, response: str):
+        """Store ``response`` under ``key``."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+            (key, response, time.time())
+        )
+        self._conn.commit()
+
+
+_CACHE_DISABLED = False
+
+
+def disable_llm_cache():
+    """Bypass the response cache for the rest of the process (``--no-cache``)."""
+    global _CACHE_DISABLED
+    _CACHE_DISABLED = True
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the shared LLM cache, or None when caching is disabled."""
+    if _CACHE_DISABLED:
+        return None
+    return _load_llm_cache()
+
+
+@lru_cache(maxsize=1)
+def _load_llm_cache() -> Optional[LLMCache]:
+    cache_config = get_config_loader().get_cache_config()
+    if not cache_config.get("enabled", False):
+        return None
+    return LLMCache(
+        path=cache_config.get("path", ".cache/llm_cache.sqlite"),
+        ttl_days=cache_config.get("ttl_days", 30),
+        max_entries=cache_config.get("max_entries")
+    )
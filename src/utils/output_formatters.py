@@ -2,45 +2,68 @@
 Output formatters for saving review results to files.
 """
 
+import asyncio
 import json
 import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 class OutputFormatter:
     """Handles formatting and saving review outputs."""
     
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         self.logger = logging.getLogger(__name__)
+        # Executor used by the async save methods (None means the loop's default)
+        self.executor = executor
+        # Directories already created by this formatter
+        self._ensured_dirs = set()
+    
+    def _ensure_dir(self, path: Path):
+        """mkdir a directory once per formatter instead of on every save."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
+    async def _run_io(self, func, *args):
+        """Run a blocking save method on the executor without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
     
     def save_role_feedback(self, role_outputs: List[Dict[str, Any]], output_dir: Path):
         """
         Save individual role feedback to markdown files.
         """
         feedback_dir = output_dir / "feedback"
-        feedback_dir.mkdir(parents=True, exist_ok=True)
-        
-        for output in role_outputs:
-            role_name = output.get("role_name", "unknown")
-            feedback = output.get("feedback", "")
-            
-            # Create markdown file
-            filename = f"{role_name.lower()}.md"
-            filepath = feedback_dir / filename
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(f"# {role_name} Review\n\n")
-                f.write(feedback)
-            
-            # Removed self.logger.info
+        self._ensure_dir(feedback_dir)
+        
+        if len(role_outputs) < 2:
+            for output in role_outputs:
+                self._write_role_feedback(output, feedback_dir)
+            return
+        # File writes release the GIL, so independent files can be written concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(role_outputs))) as executor:
+            list(executor.map(lambda output: self._write_role_feedback(output, feedback_dir), role_outputs))
+    
+    def _write_role_feedback(self, output: Dict[str, Any], feedback_dir: Path):
+        """Write one role's feedback markdown file."""
+        role_name = output.get("role_name", "unknown")
+        feedback = output.get("feedback", "")
+        
+        # Create markdown file
+        filename = f"{role_name.lower()}.md"
+        filepath = feedback_dir / filename
+        
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(f"# {role_name} Review\n\n{feedback}")
     
     def save_agent_feedback(self, agent_output: Dict[str, Any], output_dir: Path):
         """
         Save individual agent feedback to markdown files.
         """
         feedback_dir = output_dir / "feedback"
-        feedback_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(feedback_dir)
         
         agent_name = agent_output.get("agent_name", "unknown")
         feedback = agent_output.get("feedback", "")
@@ -51,21 +74,23 @@ class OutputFormatter:
         filename = f"{agent_name.lower()}.md"
         filepath = feedback_dir / filename
         
+        parts = [f"# {agent_name.replace('_', ' ').title()} Review\n\n", feedback]
+        
+        # Add scores if available
+        if scores:
+            parts.append("\n## Scores\n\n")
+            for criterion, score in scores.items():
+                parts.append(f"- **{criterion}**: {score}\n")
+        
+        # Add action items if available
+        if action_items:
+            parts.append("\n## Action Items\n\n")
+            for i, item in enumerate(action_items, 1):
+                parts.append(f"{i}. {item}\n")
+        
+        # Build the whole file first so it goes out in one write
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"# {agent_name.replace('_', ' ').title()} Review\n\n")
-            f.write(feedback)
-            
-            # Add scores if available
-            if scores:
-                f.write("\n## Scores\n\n")
-                for criterion, score in scores.items():
-                    f.write(f"- **{criterion}**: {score}\n")
-            
-            # Add action items if available
-            if action_items:
-                f.write("\n## Action Items\n\n")
-                for i, item in enumerate(action_items, 1):
-                    f.write(f"{i}. {item}\n")
+            f.write("".join(parts))
         
         # Removed self.logger.info
     
@@ -86,52 +111,92 @@ class OutputFormatter:
         """
         action_items_path = output_dir / "action_items.md"
         
+        lines = ["# Action Items\n\n"]
+        lines.extend(f"{i}. {item}\n" for i, item in enumerate(action_items, 1))
         with open(action_items_path, "w", encoding="utf-8") as f:
-            f.write("# Action Items\n\n")
-            for i, item in enumerate(action_items, 1):
-                f.write(f"{i}. {item}\n")
+            f.write("".join(lines))
         
         # Removed self.logger.info
     
+    async def asave_agent_feedback(self, agent_output: Dict[str, Any], output_dir: Path):
+        """
+        Async variant of save_agent_feedback.
+        """
+        await self._run_io(self.save_agent_feedback, agent_output, output_dir)
+    
+    async def asave_summary(self, summary: str, output_dir: Path):
+        """
+        Async variant of save_summary.
+        """
+        await self._run_io(self.save_summary, summary, output_dir)
+    
+    async def asave_action_items(self, action_items: List[str], output_dir: Path):
+        """
+        Async variant of save_action_items.
+        """
+        await self._run_io(self.save_action_items, action_items, output_dir)
+    
     def save_all_outputs(self, review_state: Any):
         """
         Save all review outputs to files.
         """
         output_dir = review_state.output_dir
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
         
-        # Save role feedback
-        self.save_role_feedback(review_state.all_role_outputs, output_dir)
+        # Save per-agent feedback
+        for agent_output in review_state.agent_outputs.values():
+            if agent_output:
+                self.save_agent_feedback(agent_output, output_dir)
         
         # Save summary
-        self.save_summary(review_state.summary, output_dir)
+        if review_state.summary:
+            self.save_summary(review_state.summary, output_dir)
         
         # Save action items
-        self.save_action_items(review_state.action_items, output_dir)
+        if review_state.action_items:
+            self.save_action_items(review_state.action_items, output_dir)
         
         # Removed self.logger.info
     
+    async def asave_all_outputs(self, review_state: Any):
+        """
+        Save per-agent feedback, the summary and action items from a ReviewState; the files are independent, so they are written concurrently.
+        """
+        output_dir = review_state.output_dir
+        self._ensure_dir(output_dir)
+        
+        save_tasks = [
+            self.asave_agent_feedback(agent_output, output_dir)
+            for agent_output in review_state.agent_outputs.values()
+            if agent_output
+        ]
+        if review_state.summary:
+            save_tasks.append(self.asave_summary(review_state.summary, output_dir))
+        if review_state.action_items:
+            save_tasks.append(self.asave_action_items(review_state.action_items, output_dir))
+        await asyncio.gather(*save_tasks)
+    
     def create_review_report(self, review_state: Any) -> str:
         """
         Create a comprehensive review report.
         """
-        report = "# Proposal Review Report\n\n"
+        parts = ["# Proposal Review Report\n\n"]
         
         # Add summary
         if review_state.summary:
-            report += review_state.summary + "\n\n"
+            parts.append(review_state.summary + "\n\n")
         
         # Add scores
         if review_state.consolidated_scores:
-            report += "## Detailed Scores\n\n"
+            parts.append("## Detailed Scores\n\n")
             for criterion, score in review_state.consolidated_scores.items():
-                report += f"- **{criterion}**: {score}\n"
-            report += "\n"
+                parts.append(f"- **{criterion}**: {score}\n")
+            parts.append("\n")
         
         # Add action items
         if review_state.action_items:
-            report += "## Action Items\n\n"
+            parts.append("## Action Items\n\n")
             for i, item in enumerate(review_state.action_items, 1):
-                report += f"{i}. {item}\n"
+                parts.append(f"{i}. {item}\n")
         
-        return report 
\ No newline at end of file
+        return "".join(parts) 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Retry helper for transient LLM API failures.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+T = TypeVar("T")
+
+# Errors worth retrying; anything else (bad request, auth) fails immediately
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+async def with_retry(coro_factory: Callable[[], Awaitable[T]], max_attempts: int = 5,
+                     base_delay: float = 1.0, logger: Optional[logging.Logger] = None) -> T:
+    """Await ``coro_factory()`` with exponential backoff and jitter on transient API errors."""
+    logger = logger or logging.getLogger(__name__)
+    for attempt in range(max_attempts):
+        try:
+            return await coro_factory()
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+            logger.warning(f"LLM call failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{max_attempts})")
+            await asyncio.sleep(delay)
@@ -2,18 +2,43 @@
 LangGraph workflow for multi-role proposal review using configurable agents.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List, Callable
+from functools import lru_cache
+from typing import Dict, Any, List, Callable, Optional, Tuple
 from pathlib import Path
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 import os
-import json
+import shutil
+import subprocess
 
 from .state_models import ReviewState
 from ..agents.agent_factory import AgentFactory
-from ..core.document_processor import DocumentProcessor
+from ..core.document_processor import (
+    DocumentProcessor, file_sha256, load_from_content_store, processed_json_stamp, read_processed_json, restore_sections
+)
 from ..core.file_discovery import FileDiscovery
+from ..utils import json_io
+from ..utils.config_loader import get_config_loader
+from ..utils.batch_client import BatchDispatcher
+from ..utils.retry import RETRYABLE_ERRORS
+
+
+@lru_cache(maxsize=8)
+def _load_criteria(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a criteria.json once per process; the mtime in the key re-reads an edited file."""
+    return json_io.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=512)
+def _read_processed(path: str, stamp: Tuple) -> Dict[str, Any]:
+    """Parse a processed-document sidecar once per process; the stamp in the key re-reads a rewritten file.
+
+    Callers share the returned dict.
+    """
+    return read_processed_json(Path(path))
 
 
 class ReviewWorkflow:
@@ -21,7 +46,8 @@ class ReviewWorkflow:
     
     def __init__(self, openai_client: ChatOpenAI, agent_config: List[str] = None, 
                  proposal_dir: Path = None, supporting_dir: Path = None, 
-                 solicitation_dir: Path = None, should_process_docs: bool = True):
+                 solicitation_dir: Path = None, should_process_docs: bool = True,
+                 batch_mode: bool = False):
         self.client = openai_client
         self.logger = logging.getLogger(__name__)
         
@@ -45,27 +71,43 @@ class ReviewWorkflow:
         # Create agents
         self.agents = self.agent_factory.create_agents_from_config(agent_config)
         self.agent_config = agent_config
+        self._agent_set = frozenset(agent_config)
+        
+        # Offline mode: pool free-text agent calls into one Batch API job
+        # (panel_scorer keeps real-time structured calls)
+        self.batch_mode = batch_mode
+        if batch_mode:
+            dispatcher = BatchDispatcher()
+            for agent_id, agent in self.agents.items():
+                if agent_id != "panel_scorer":
+                    agent.batch_dispatcher = dispatcher
+        
+        # Created on first use: visualization-only and --no-process-docs workflows never need one
+        self._document_processor = None
         
         # Create the workflow graph
         self.graph = self._create_workflow()
     
+    @property
+    def document_processor(self) -> DocumentProcessor:
+        """DocumentProcessor shared by every document-processing step of this workflow."""
+        if self._document_processor is None:
+            self._document_processor = DocumentProcessor()
+        return self._document_processor
+    
     def _create_workflow(self) -> StateGraph:
-        """Create the LangGraph workflow with async agent execution and join node."""
+        """Create the LangGraph workflow with async agent execution fanning in to aggregation."""
         workflow = StateGraph(ReviewState)
         workflow.add_node("process_documents", self._create_document_processing_node())
         for agent_id in self.agent_config:
             workflow.add_node(agent_id, self._create_agent_node(agent_id))
-        workflow.add_node("join_agents", self._join_agents_node)
         workflow.add_node("aggregate_results", self._aggregate_results_node)
         workflow.set_entry_point("process_documents")
         # Fan-out: process_documents → all agents
         for agent_id in self.agent_config:
             workflow.add_edge("process_documents", agent_id)
-        # Fan-in: all agents → join_agents
-        for agent_id in self.agent_config:
-            workflow.add_edge(agent_id, "join_agents")
-        # Join to aggregation
-        workflow.add_edge("join_agents", "aggregate_results")
+        # Fan-in: aggregation waits for every agent
+        workflow.add_edge(list(self.agent_config), "aggregate_results")
         workflow.add_edge("aggregate_results", END)
         return workflow.compile()
     
@@ -79,77 +121,45 @@ class ReviewWorkflow:
             else:
                 self.logger.info("Using cached processed documents (--no-process-docs flag)")
             
-            # Process main proposal
-            if self.proposal_dir and self.proposal_dir.exists():
-                file_discovery = FileDiscovery()
-                main_proposal_path = file_discovery.find_main_proposal(self.proposal_dir)
-                
-                if main_proposal_path:
-                    if self.should_process_docs:
-                        processor = DocumentProcessor()
-                        proposal_data = processor.process_main_proposal(main_proposal_path)
-                    else:
-                        # Load from cache only without creating DocumentProcessor
-                        proposal_data = self._load_cached_document(main_proposal_path, "main_proposal")
-                    
-                    if 'full_text' not in proposal_data:
-                        raise ValueError(f"Main proposal processing failed: missing 'full_text' field. Available fields: {list(proposal_data.keys())}")
-                    state.proposal_text = proposal_data['full_text']
-                    if not state.proposal_text or state.proposal_text.strip() == "":
-                        raise ValueError("Main proposal has empty or missing content")
-                    self.logger.info(f"Processed main proposal: {len(state.proposal_text)} characters")
-                else:
-                    raise FileNotFoundError("No main proposal found")
-            else:
-                raise FileNotFoundError("No proposal directory found")
+            # Batch reviews carry their own proposal folders; single reviews use the workflow's
+            proposal_dir = state.proposal_dir or self.proposal_dir
+            supporting_dir = state.supporting_dir or self.supporting_dir
             
-            # Process supporting documents
-            if self.supporting_dir and self.supporting_dir.exists():
-                if self.should_process_docs:
-                    processor = DocumentProcessor()
-                    supporting_docs = processor.process_supporting_docs(self.supporting_dir)
-                else:
-                    # Load from cache only without creating DocumentProcessor
-                    supporting_docs = []
-                    for doc_path in FileDiscovery().find_supporting_docs(self.supporting_dir):
-                        doc_data = self._load_cached_document(doc_path, "supporting")
-                        supporting_docs.append(doc_data)
-                
-                state.supporting_docs = supporting_docs
-                self.logger.info(f"Processed {len(state.supporting_docs)} supporting documents")
-            else:
-                raise FileNotFoundError("No supporting documents directory found")
+            # One discovery instance, so each directory tree is walked once per run
+            file_discovery = FileDiscovery()
             
-            # Process solicitation documents and load criteria
-            if self.solicitation_dir and self.solicitation_dir.exists():
-                if self.should_process_docs:
-                    processor = DocumentProcessor()
-                    solicitation_data = processor.process_solicitation_docs(self.solicitation_dir)
-                else:
-                    # Load from cache only without creating DocumentProcessor
-                    solicitation_docs = []
-                    file_discovery = FileDiscovery()
-                    solicitation_files = file_discovery.find_solicitation_docs(self.solicitation_dir)
-                    
-                    # Iterate through all file types
-                    for file_type, file_paths in solicitation_files.items():
-                        for doc_path in file_paths:
-                            doc_data = self._load_cached_document(doc_path, "solicitation")
-                            solicitation_docs.append(doc_data)
-                    solicitation_data = {"solicitation_documents": solicitation_docs}
-                
-                state.solicitation_md = self._create_solicitation_markdown(solicitation_data["solicitation_documents"])
-                
-                # Load criteria from static file
-                criteria_file = self.solicitation_dir / "criteria.json"
-                if criteria_file.exists():
-                    with open(criteria_file, 'r', encoding='utf-8') as f:
-                        state.criteria = json.load(f)
-                    self.logger.info(f"Loaded criteria from {criteria_file}")
-                else:
-                    raise FileNotFoundError(f"criteria.json not found in {self.solicitation_dir}")
+            # Check inputs up front before any document work starts; the directory walk
+            # runs off the event loop so concurrent reviews are not stalled by disk I/O
+            main_proposal_path = await asyncio.to_thread(self._check_inputs, file_discovery, proposal_dir, supporting_dir)
+            
+            if state.solicitation_preloaded:
+                # Solicitation already prepared once by run_review_batch; concurrent proposals each get
+                # their own processor so per-run state such as prerendered PDFs is never shared
+                proposal_data, supporting_docs = await self._prepare_proposal(
+                    file_discovery, main_proposal_path, supporting_dir,
+                    DocumentProcessor() if self.should_process_docs else None
+                )
             else:
-                raise FileNotFoundError("No solicitation directory found")
+                # Criteria first, so a missing criteria.json fails before any processing
+                state.criteria = await asyncio.to_thread(self._read_criteria)
+                # Proposal and solicitation are independent, so their documents are prepared concurrently
+                (proposal_data, supporting_docs), state.solicitation_md = await asyncio.gather(
+                    self._prepare_proposal(file_discovery, main_proposal_path, supporting_dir,
+                                           self.document_processor if self.should_process_docs else None),
+                    self._prepare_solicitation(file_discovery)
+                )
+            
+            # Main proposal
+            if 'full_text' not in proposal_data:
+                raise ValueError(f"Main proposal processing failed: missing 'full_text' field. Available fields: {list(proposal_data.keys())}")
+            state.proposal_text = proposal_data['full_text']
+            if not state.proposal_text or state.proposal_text.strip() == "":
+                raise ValueError("Main proposal has empty or missing content")
+            self.logger.info(f"Processed main proposal: {len(state.proposal_text)} characters")
+            
+            # Supporting documents
+            state.supporting_docs = supporting_docs
+            self.logger.info(f"Processed {len(state.supporting_docs)} supporting documents")
             
             # Mark documents as processed
             state.documents_processed = True
@@ -159,10 +169,105 @@ class ReviewWorkflow:
         
         return process_documents
     
+    def _check_inputs(self, file_discovery: FileDiscovery, proposal_dir: Path, supporting_dir: Path) -> Path:
+        """Verify the input directories exist and return the main proposal path."""
+        if not (proposal_dir and proposal_dir.exists()):
+            raise FileNotFoundError("No proposal directory found")
+        main_proposal_path = file_discovery.find_main_proposal(proposal_dir)
+        if not main_proposal_path:
+            raise FileNotFoundError("No main proposal found")
+        if not (supporting_dir and supporting_dir.exists()):
+            raise FileNotFoundError("No supporting documents directory found")
+        if not (self.solicitation_dir and self.solicitation_dir.exists()):
+            raise FileNotFoundError("No solicitation directory found")
+        return main_proposal_path
+    
+    def _read_criteria(self) -> Dict[str, Any]:
+        """Load the solicitation's criteria.json (memoized by mtime)."""
+        criteria_file = self.solicitation_dir / "criteria.json"
+        try:
+            criteria_mtime = criteria_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"criteria.json not found in {self.solicitation_dir}")
+        criteria = _load_criteria(str(criteria_file), criteria_mtime)
+        self.logger.info(f"Loaded criteria from {criteria_file}")
+        return criteria
+    
+    async def _prepare_proposal(self, file_discovery: FileDiscovery, main_proposal_path: Path, supporting_dir: Path,
+                                processor: Optional[DocumentProcessor]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Return the processed main proposal and supporting documents (``processor`` is None on cached runs)."""
+        if processor is not None:
+            # Worker threads, so cache probes, parsing and saves overlap (Marker conversions are serialized inside)
+            return await asyncio.gather(
+                asyncio.to_thread(processor.process_main_proposal, main_proposal_path),
+                asyncio.to_thread(processor.process_supporting_docs, supporting_dir)
+            )
+        # Load from cache only without creating DocumentProcessor
+        supporting_paths = await asyncio.to_thread(file_discovery.find_supporting_docs, supporting_dir)
+        docs = await self._load_many([(main_proposal_path, "main_proposal")] + [(p, "supporting") for p in supporting_paths])
+        return docs[0], docs[1:]
+    
+    async def _prepare_solicitation(self, file_discovery: FileDiscovery) -> str:
+        """Return the combined solicitation markdown, reusing the saved copy on cached runs."""
+        solicitation_files = await asyncio.to_thread(file_discovery.find_solicitation_docs, self.solicitation_dir)
+        if self.should_process_docs:
+            solicitation_data = await asyncio.to_thread(self.document_processor.process_solicitation_docs, self.solicitation_dir)
+            solicitation_docs = solicitation_data["solicitation_documents"]
+        else:
+            solicitation_md = await asyncio.to_thread(self._load_combined_solicitation, solicitation_files)
+            if solicitation_md is not None:
+                return solicitation_md
+            # Iterate through all file types
+            solicitation_docs = await self._load_many(
+                [(doc_path, "solicitation") for file_paths in solicitation_files.values() for doc_path in file_paths]
+            )
+        solicitation_md = self._create_solicitation_markdown(solicitation_docs)
+        await asyncio.to_thread(self._save_combined_solicitation, solicitation_files, solicitation_md)
+        return solicitation_md
+    
+    def _combined_solicitation_path(self) -> Path:
+        # .json rather than .md so solicitation discovery never picks it up as an input
+        return self.solicitation_dir / "processed" / "solicitation_combined.json"
+    
+    @staticmethod
+    def _solicitation_inventory(solicitation_files: Dict[str, List[Path]]) -> List[List[Any]]:
+        """[path, mtime_ns, size] for every solicitation source, in discovery order."""
+        inventory = []
+        for file_paths in solicitation_files.values():
+            for doc_path in file_paths:
+                st = doc_path.stat()
+                inventory.append([str(doc_path), st.st_mtime_ns, st.st_size])
+        return inventory
+    
+    def _load_combined_solicitation(self, solicitation_files: Dict[str, List[Path]]) -> Optional[str]:
+        """Return the saved combined solicitation markdown if it was built from the current sources, else None."""
+        try:
+            saved = json_io.loads(self._combined_solicitation_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+        if saved.get("inventory") != self._solicitation_inventory(solicitation_files):
+            return None
+        self.logger.info("Using cached combined solicitation markdown")
+        return saved.get("markdown")
+    
+    def _save_combined_solicitation(self, solicitation_files: Dict[str, List[Path]], markdown: str):
+        """Save the combined solicitation markdown with the source inventory it was built from."""
+        path = self._combined_solicitation_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(json_io.dumps({
+                "inventory": self._solicitation_inventory(solicitation_files),
+                "markdown": markdown
+            }))
+        except OSError as e:
+            self.logger.warning(f"Could not save combined solicitation markdown: {e}")
+    
+    async def _load_many(self, items: List[Tuple[Path, str]]) -> List[Dict[str, Any]]:
+        """Load cached documents concurrently in worker threads; results keep the order of ``items``."""
+        return await asyncio.gather(*(asyncio.to_thread(self._load_cached_document, path, doc_type) for path, doc_type in items))
+    
     def _load_cached_document(self, original_path: Path, doc_type: str) -> Dict[str, Any]:
         """Load a cached processed document without creating DocumentProcessor."""
-        import json
-        
         # Get the processed document path
         if doc_type == "main_proposal":
             # Main proposal is stored in the proposal directory's processed folder
@@ -177,7 +282,7 @@ class ReviewWorkflow:
             # original_path could be like: documents/solicitation/supporting_docs/file.csv
             # or: documents/solicitation/file.pdf
             # We need: documents/solicitation/processed/
-            if "supporting_docs" in str(original_path):
+            if "supporting_docs" in original_path.parts:
                 processed_dir = original_path.parent.parent / "processed"
             else:
                 processed_dir = original_path.parent / "processed"
@@ -192,20 +297,30 @@ class ReviewWorkflow:
         else:
             processed_path = processed_dir / f"{base_name}_processed.json"
         
-        if not processed_path.exists():
-            raise FileNotFoundError(f"Cached processed document not found: {processed_path}")
-        
         try:
-            with open(processed_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.logger.info(f"Loaded cached document: {list(data.keys()) if data else 'None'}")
-                
-                # Extract the standardized structure from the cached wrapper
-                if 'content' in data:
-                    return data['content']
-                else:
-                    # Fallback to the data itself if no content wrapper
-                    return data
+            data = _read_processed(str(processed_path), processed_json_stamp(processed_path))
+            self.logger.info(f"Loaded cached document: {list(data.keys()) if data else 'None'}")
+            
+            cached_sha = data.get("source_sha256") if data else None
+            if cached_sha and original_path.exists() and cached_sha != file_sha256(original_path):
+                self.logger.warning(f"{original_path.name} changed since it was processed; "
+                                    f"rerun without --no-process-docs to refresh it")
+            
+            # Extract the standardized structure from the cached wrapper
+            if 'content' in data:
+                return restore_sections(data['content'])
+            else:
+                # Fallback to the data itself if no content wrapper
+                return data
+        except FileNotFoundError:
+            # A renamed or moved file reuses its content-store entry without getting a sidecar of its own
+            content = None
+            if original_path.exists():
+                content = load_from_content_store(original_path, "proposal" if doc_type == "main_proposal" else doc_type)
+            if content is None:
+                raise FileNotFoundError(f"Cached processed document not found: {processed_path}")
+            self.logger.info(f"Loaded cached document by content: {original_path.name}")
+            return content
         except Exception as e:
             self.logger.error(f"Failed to load cached document {processed_path}: {e}")
             raise RuntimeError(f"Failed to load cached document {processed_path}: {e}")
@@ -215,7 +330,8 @@ class ReviewWorkflow:
         if not solicitation_documents:
             raise ValueError("No solicitation documents found")
         
-        markdown = "# Solicitation Documents Summary\n\n"
+        # Collect the pieces and join once; += would recopy every earlier document
+        parts = ["# Solicitation Documents Summary\n\n"]
         
         for doc in solicitation_documents:
             if 'full_text' not in doc:
@@ -223,13 +339,23 @@ class ReviewWorkflow:
             content_text = doc['full_text']
             if not content_text or content_text.strip() == "":
                 raise ValueError(f"Solicitation document {doc.get('file_name', 'unknown')} has empty or missing content")
-            markdown += f"## {doc['file_name']}\n\n"
-            markdown += f"{content_text}\n\n"
+            parts.append(f"## {doc['file_name']}\n\n{content_text}\n\n")
         
-        return markdown
+        return "".join(parts)
     
     def _create_agent_node(self, agent_id: str):
         """Create a node for a specific agent that only updates its own output."""
+        # Resolve the agent and its call signature once, not on every invocation
+        agent = self.agents[agent_id]
+        if agent_id == "panel_scorer":
+            def invoke(state: ReviewState):
+                return agent.review(state.proposal_text, state.supporting_docs, state.criteria,
+                                    state.solicitation_md, state.output_dir)
+        else:
+            def invoke(state: ReviewState):
+                return agent.review(state.proposal_text, state.supporting_docs, state.criteria,
+                                    state.solicitation_md)
+        
         async def agent_node(state: ReviewState) -> Dict[str, Any]:
             if not state.documents_processed:
                 self.logger.error("Documents not processed, skipping agent review")
@@ -239,24 +365,13 @@ class ReviewWorkflow:
                 return {}
             self.logger.info(f"Running {agent_id} review")
             try:
-                agent = self.agents[agent_id]
-                if agent_id == "panel_scorer":
-                    output = await agent.review(
-                        state.proposal_text,
-                        state.supporting_docs,
-                        state.criteria,
-                        state.solicitation_md,
-                        state.output_dir
-                    )
-                else:
-                    output = await agent.review(
-                        state.proposal_text,
-                        state.supporting_docs,
-                        state.criteria,
-                        state.solicitation_md
-                    )
+                output = await invoke(state)
                 self.logger.info(f"{agent_id} review completed")
-                return {"agent_outputs": {agent_id: output.dict()}}
+                return {"agent_outputs": {agent_id: output.model_dump()}}
+            except RETRYABLE_ERRORS as e:
+                # Already retried with backoff; a persistent API failure should fail the run, not pose as a review
+                self.logger.error(f"{agent_id} review failed after retries: {e}")
+                raise
             except Exception as e:
                 self.logger.error(f"{agent_id} review failed: {e}")
                 error_output = {
@@ -269,42 +384,30 @@ class ReviewWorkflow:
                 return {"agent_outputs": {agent_id: error_output}}
         return agent_node
 
-    def _join_agents_node(self, state: ReviewState) -> ReviewState:
-        """Wait until all agent outputs are present, then proceed."""
-        if set(self.agent_config).issubset(set(state.agent_outputs.keys())):
-            self.logger.info("All agent reviews complete. Proceeding to aggregation.")
-            return state
-        else:
-            self.logger.info("Waiting for all agent reviews to complete...")
-            return state
-    
     async def _aggregate_results_node(self, state: ReviewState) -> ReviewState:
         """Aggregate results from all agents."""
+        if not self._agent_set.issubset(state.agent_outputs):
+            missing = self._agent_set - state.agent_outputs.keys()
+            self.logger.warning(f"Aggregating without output from: {', '.join(sorted(missing))}")
         self.logger.info("Aggregating results from all agents")
         
-        # Collect all agent outputs
+        # Collect outputs, scores and action items in a single pass over the agents
         agent_outputs = []
-        for agent_id in self.agent_config:
-            output = state.agent_outputs.get(agent_id, None)
-            if output:
-                agent_outputs.append(output)
-        
-        state.all_agent_outputs = agent_outputs
-        
-        # Consolidate scores
         consolidated_scores = {}
-        for output in agent_outputs:
-            if output.get("scores"):
-                consolidated_scores.update(output["scores"])
-        
-        state.consolidated_scores = consolidated_scores
-        
-        # Consolidate action items
         all_action_items = []
-        for output in agent_outputs:
-            if output.get("action_items"):
-                all_action_items.extend(output["action_items"])
+        for output in map(state.agent_outputs.get, self.agent_config):
+            if not output:
+                continue
+            agent_outputs.append(output)
+            scores = output.get("scores")
+            if scores:
+                consolidated_scores.update(scores)
+            action_items = output.get("action_items")
+            if action_items:
+                all_action_items.extend(action_items)
         
+        state.all_agent_outputs = agent_outputs
+        state.consolidated_scores = consolidated_scores
         state.action_items = all_action_items
         
         # Create summary
@@ -316,46 +419,43 @@ class ReviewWorkflow:
     
     def _create_summary(self, agent_outputs: list, consolidated_scores: Dict[str, float], action_items: List[str]) -> str:
         """Create a consolidated summary of all reviews."""
-        summary = "# Multi-Agent Review Summary\n\n"
+        parts = ["# Multi-Agent Review Summary\n\n"]
 
         # Add a prominent reviewer scores table
-        summary += "## Reviewer Scores Overview\n\n"
-        summary += "| Agent | Criterion | Score |\n|---|---|---|\n"
+        parts.append("## Reviewer Scores Overview\n\n")
+        parts.append("| Agent | Criterion | Score |\n|---|---|---|\n")
         for output in agent_outputs:
             agent_name = output.get("agent_name", "Unknown").replace('_', ' ').title()
             scores = output.get("scores", {})
             if scores:
                 for criterion, score in scores.items():
-                    summary += f"| {agent_name} | {criterion} | {score} |\n"
-        summary += "\n"
+                    parts.append(f"| {agent_name} | {criterion} | {score} |\n")
+        parts.append("\n")
 
         # Add agent-specific summaries
         for output in agent_outputs:
             agent_name = output.get("agent_name", "Unknown")
             feedback = output.get("feedback", "")
             scores = output.get("scores", {})
-            summary += f"## {agent_name.replace('_', ' ').title()}\n\n"
-            summary += f"{feedback}\n\n"
+            parts.append(f"## {agent_name.replace('_', ' ').title()}\n\n")
+            parts.append(f"{feedback}\n\n")
             if scores:
-                summary += "**Scores:**\n"
-                for criterion, score in scores.items():
-                    summary += f"- {criterion}: {score}\n"
-                summary += "\n"
+                parts.append("**Scores:**\n")
+                parts.extend(f"- {criterion}: {score}\n" for criterion, score in scores.items())
+                parts.append("\n")
 
         # Add consolidated scores
         if consolidated_scores:
-            summary += "## Consolidated Scores\n\n"
-            for criterion, score in consolidated_scores.items():
-                summary += f"- **{criterion}**: {score}\n"
-            summary += "\n"
+            parts.append("## Consolidated Scores\n\n")
+            parts.extend(f"- **{criterion}**: {score}\n" for criterion, score in consolidated_scores.items())
+            parts.append("\n")
 
         # Add action items
         if action_items:
-            summary += "## Action Items\n\n"
-            for i, item in enumerate(action_items, 1):
-                summary += f"{i}. {item}\n"
+            parts.append("## Action Items\n\n")
+            parts.extend(f"{i}. {item}\n" for i, item in enumerate(action_items, 1))
 
-        return summary
+        return "".join(parts)
     
     async def run_review(self, output_dir: Path) -> ReviewState:
         """Run the complete review workflow."""
@@ -365,6 +465,36 @@ class ReviewWorkflow:
         initial_state = ReviewState(
             output_dir=output_dir
         )
+        return await self._run(initial_state)
+    
+    async def run_review_batch(self, proposals: List[Tuple[Path, Path]], output_dirs: List[Path]) -> List[ReviewState]:
+        """Review several proposals against this workflow's solicitation, preparing the solicitation once.
+
+        ``proposals`` holds (proposal_dir, supporting_dir) pairs, matched to ``output_dirs`` by position.
+        """
+        if len(proposals) != len(output_dirs):
+            raise ValueError(f"Got {len(proposals)} proposals but {len(output_dirs)} output directories")
+        if not (self.solicitation_dir and self.solicitation_dir.exists()):
+            raise FileNotFoundError("No solicitation directory found")
+        self.logger.info(f"Starting batch review of {len(proposals)} proposals")
+        
+        criteria = await asyncio.to_thread(self._read_criteria)
+        solicitation_md = await self._prepare_solicitation(FileDiscovery())
+        return await asyncio.gather(*(
+            self._run(ReviewState(
+                output_dir=Path(output_dir),
+                proposal_dir=Path(proposal_dir),
+                supporting_dir=Path(supporting_dir),
+                solicitation_md=solicitation_md,
+                criteria=criteria,
+                solicitation_preloaded=True
+            ))
+            for (proposal_dir, supporting_dir), output_dir in zip(proposals, output_dirs)
+        ))
+    
+    async def _run(self, initial_state: ReviewState) -> ReviewState:
+        """Invoke the graph on ``initial_state`` and return the final ReviewState."""
+        output_dir = initial_state.output_dir
         
         # Run the workflow
         final_state = await self.graph.ainvoke(initial_state)
@@ -406,36 +536,92 @@ class ReviewWorkflow:
         """Get information about available agents."""
         return self.agent_factory.get_available_agents() 
 
-def create_workflow_visualization(agents: list = None, output_dir: Path = Path("output")):
-    """Create and save a workflow graph visualization as a PNG. Returns the PNG file path or None."""
-    import json
-    from pathlib import Path
-    from langchain_openai import ChatOpenAI
+# Rendered diagrams, named by the SHA-256 of their mermaid source
+_WORKFLOW_PNG_CACHE_DIR = Path(".cache/workflow_graphs")
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+def _render_mermaid_png(mermaid_src: str, dest: Path) -> bool:
+    """Render mermaid text to a PNG file with the local mmdr renderer; False if it is unavailable.
+
+    draw_mermaid_png() goes through the mermaid.ink web service; mmdr renders in-process in milliseconds.
+    The image is streamed straight to disk rather than held in memory.
+    """
+    mmdr = shutil.which("mmdr")
+    if mmdr is None:
+        return False
+    tmp_path = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            result = subprocess.run(
+                [mmdr, "--input", "-", "--output", "-", "--format", "png"],
+                input=mermaid_src.encode("utf-8"), stdout=f, stderr=subprocess.PIPE, timeout=30
+            )
+        with open(tmp_path, "rb") as f:
+            valid = result.returncode == 0 and f.read(len(_PNG_MAGIC)) == _PNG_MAGIC
+        if valid:
+            os.replace(tmp_path, dest)
+            return True
+        error = result.stderr.decode("utf-8", "replace").strip()
+    except (OSError, subprocess.SubprocessError) as e:
+        error = e
+    logging.getLogger(__name__).warning(f"mmdr failed, falling back to mermaid.ink: {error}")
+    tmp_path.unlink(missing_ok=True)
+    return False
 
-    if agents is None:
-        config_path = Path("config/system_config.json")
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            agents = config.get("default_agents", [])
-        else:
-            agents = ["tech_lead", "business_strategist", "detail_checker", "panel_scorer", "storyteller"]
 
+@lru_cache(maxsize=8)
+def _workflow_diagram(agents: tuple):
+    """Build the workflow graph for an agent lineup once and return (drawable graph, mermaid source)."""
     mock_client = ChatOpenAI(api_key="mock-key", model="gpt-4o")
     workflow = ReviewWorkflow(
         mock_client,
-        agents,
+        list(agents),
         proposal_dir=Path("documents/proposal"),
         supporting_dir=Path("documents/proposal/supporting_docs"),
         solicitation_dir=Path("documents/solicitation")
     )
-    app = workflow.graph
+    graph = workflow.graph.get_graph()
+    return graph, graph.draw_mermaid()
+
+
+def create_workflow_visualization(agents: list = None, output_dir: Path = Path("output")):
+    """Create and save a workflow graph visualization as a PNG. Returns the PNG file path or None."""
+    if agents is None:
+        try:
+            agents = get_config_loader().get_default_agents()
+        except FileNotFoundError:
+            agents = ["tech_lead", "business_strategist", "detail_checker", "panel_scorer", "storyteller"]
+
+    png_file = output_dir / "workflow.png"
+    # Records the digest of the mermaid source workflow.png was last drawn from
+    sentinel_file = output_dir / ".workflow.png.sha256"
+
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
-        png_file = output_dir / "workflow.png"
-        png_data = app.get_graph().draw_mermaid_png()
-        with open(png_file, "wb") as f:
-            f.write(png_data)
+        graph, mermaid_src = _workflow_diagram(tuple(agents))
+        # The mermaid source captures every node and edge, so it keys the rendered image
+        digest = hashlib.sha256(mermaid_src.encode('utf-8')).hexdigest()
+        try:
+            if png_file.exists() and sentinel_file.read_text(encoding="utf-8") == digest:
+                return str(png_file)
+        except OSError:
+            pass
+        cache_path = _WORKFLOW_PNG_CACHE_DIR / f"{digest}.png"
+        if not cache_path.exists():
+            if not _render_mermaid_png(mermaid_src, cache_path):
+                png_data = graph.draw_mermaid_png()
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_bytes(png_data)
+                except OSError as e:
+                    logging.getLogger(__name__).warning(f"Could not cache workflow diagram: {e}")
+                    png_file.write_bytes(png_data)
+                    return str(png_file)
+        shutil.copyfile(cache_path, png_file)
+        sentinel_file.write_text(digest, encoding="utf-8")
         return str(png_file)
     except Exception as e:
         print(f"Error generating workflow visualization: {e}")
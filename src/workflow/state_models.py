@@ -3,7 +3,7 @@ State models for the LangGraph review workflow.
 """
 
 from typing import Dict, Any, List, Optional, Annotated
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pathlib import Path
 
 def merge_dicts(left, right, **kwargs):
@@ -18,10 +18,17 @@ def merge_dicts(left, right, **kwargs):
 class ReviewState(BaseModel):
     """State model for the review workflow."""
     
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     # Document processing status
     documents_processed: bool = Field(default=False, description="Whether documents have been processed")
     processing_error: Optional[str] = Field(default=None, description="Error during document processing")
     
+    # Per-review input folders (run_review_batch); None uses the workflow's own
+    proposal_dir: Optional[Path] = Field(default=None, description="Proposal directory for this review")
+    supporting_dir: Optional[Path] = Field(default=None, description="Supporting documents directory for this review")
+    solicitation_preloaded: bool = Field(default=False, description="Whether solicitation_md and criteria were prepared by run_review_batch")
+    
     # Input data (populated after document processing)
     proposal_text: str = Field(default="", description="Main proposal text")
     supporting_docs: List[Dict[str, Any]] = Field(default_factory=list, description="Supporting document contents")
@@ -40,9 +47,6 @@ class ReviewState(BaseModel):
     # Output paths
     output_dir: Path = Field(description="Output directory for results")
     
-    class Config:
-        arbitrary_types_allowed = True
-    
     def is_all_agents_complete(self, expected_agents: List[str]) -> bool:
         """Check if all expected agents have completed."""
-        return set(expected_agents).issubset(set(self.agent_outputs.keys())) 
\ No newline at end of file
+        return all(agent_id in self.agent_outputs for agent_id in expected_agents) 
\ No newline at end of file